@@ -1,54 +1,49 @@
+import gc
+import os
 import statistics
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from mcp_repo_onboarding.analysis import analyze_repo
 
 
-def create_large_repo(root: Path, file_count: int, depth: int) -> None:
-    """Create a dummy repo with many files."""
-    root.mkdir(parents=True, exist_ok=True)
+def _write_files(files: list[tuple[Path, str]]) -> None:
+    """Write (path, content) pairs concurrently; file creation is I/O-bound and releases the GIL."""
 
-    # Create plain files
-    for i in range(file_count):
-        (root / f"file_{i}.txt").write_text(f"content {i}")
-        (root / f"script_{i}.py").write_text(f"print({i})")
+    def _write(item: tuple[Path, str]) -> None:
+        item[0].write_text(item[1])
 
-    # Create subdirs
-    if depth > 0:
-        for i in range(5):  # Branch factor
-            create_large_repo(root / f"dir_{i}", file_count // 5, depth - 1)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        # Consume the iterator so any write error is raised here.
+        for _ in pool.map(_write, files):
+            pass
 
 
 def run_benchmark() -> None:
     with tempfile.TemporaryDirectory() as temp_dir:
         repo_root = Path(temp_dir)
         print("Generating synthetic large repo...")
-        # ~1000 files: 200 base + 5 * (40 base)
-        # Let's try to hit ~2000 files.
-        # depth 2: 5 subdirs.
-        # create_large_repo(root, 100, 2)
 
         start_gen = time.time()
-        # Generates structure: 5000 text files, 2000 python files, 100 config files
-        # total ~7100 files
-        for i in range(5000):
-            (repo_root / f"data_{i}.txt").write_text("x" * 100)
-
-        for i in range(2000):
-            (repo_root / f"src_{i}.py").write_text("import os")
+        # Generates structure: 5000 text files, 2000 python files, 1000 nested docs,
+        # 100 config-like files -- ~8100 files in total.
+        files: list[tuple[Path, str]] = []
+        files += [(repo_root / f"data_{i}.txt", "x" * 100) for i in range(5000)]
+        files += [(repo_root / f"src_{i}.py", "import os") for i in range(2000)]
 
         # Create some nested dirs
         for d in range(10):
             subdir = repo_root / f"nested_{d}"
             subdir.mkdir()
-            for f in range(100):
-                (subdir / f"doc_{f}.md").write_text("documentation")
+            files += [(subdir / f"doc_{f}.md", "documentation") for f in range(100)]
 
         for i in range(50):
-            (repo_root / f"Makefile_{i}").write_text("test:\n\techo test")
-            (repo_root / f"tox_{i}.ini").write_text("[tox]\nenvlist = py39")
+            files.append((repo_root / f"Makefile_{i}", "test:\n\techo test"))
+            files.append((repo_root / f"tox_{i}.ini", "[tox]\nenvlist = py39"))
+
+        _write_files(files)
 
         print(f"Generation took {time.time() - start_gen:.2f}s")
         print(f"Total files: {sum(1 for _ in repo_root.rglob('*') if _.is_file())}")
@@ -56,10 +51,17 @@ def run_benchmark() -> None:
         print("Running analysis benchmark...")
         times = []
         for _ in range(5):
-            start = time.perf_counter()
-            # Use max_files=10000 to ensure everything is scanned
-            analyze_repo(str(repo_root), max_files=10000)
-            end = time.perf_counter()
+            # Collect between runs and keep the collector off while timing, so GC pauses
+            # triggered by earlier runs do not leak into the measurement.
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                # Use max_files=10000 to ensure everything is scanned
+                analyze_repo(str(repo_root), max_files=10000)
+                end = time.perf_counter()
+            finally:
+                gc.enable()
             times.append(end - start)
 
         print(f"Results (5 runs): {times}")
@@ -2,6 +2,18 @@
 import re
 from pathlib import Path
 
+# Matches: "=== Repo: [name] ===" headers that open each repo's section of the log.
+_REPO_RE = re.compile(r"=== Repo: (.*?) ===")
+
+
+def _section_status(content: str, start: int, end: int) -> str:
+    """Classify the log section content[start:end] without copying it out of the log."""
+    if content.find("Validation passed", start, end) != -1:
+        return "✅ PASS"
+    if content.find("Validation failed", start, end) != -1:
+        return "❌ FAIL"
+    return "❓ Unknown"
+
 
 def summarize_log(log_path: str = "evaluation_results.log") -> None:
     path = Path(log_path)
@@ -11,23 +23,18 @@ def summarize_log(log_path: str = "evaluation_results.log") -> None:
 
     content = path.read_text(encoding="utf-8")
 
-    # Simple regex to find repo results and validation status
-    # Matches: "=== Repo: [name] ===" and "Validation passed/failed"
-    repo_sections = re.split(r"=== Repo: (.*?) ===", content)
-
+    # Walk the repo headers with finditer; each section spans header end -> next header start
+    # and is searched in place, instead of re.split-ing the whole log into a list of pieces.
     results = []
-    if len(repo_sections) > 1:
-        for i in range(1, len(repo_sections), 2):
-            repo_name = repo_sections[i].strip()
-            section_content = repo_sections[i + 1]
-
-            status = "❓ Unknown"
-            if "Validation passed" in section_content:
-                status = "✅ PASS"
-            elif "Validation failed" in section_content:
-                status = "❌ FAIL"
-
-            results.append((repo_name, status))
+    prev: re.Match[str] | None = None
+    for match in _REPO_RE.finditer(content):
+        if prev is not None:
+            results.append(
+                (prev.group(1).strip(), _section_status(content, prev.end(), match.start()))
+            )
+        prev = match
+    if prev is not None:
+        results.append((prev.group(1).strip(), _section_status(content, prev.end(), len(content))))
 
     if not results:
         print("No evaluation results found in log.")
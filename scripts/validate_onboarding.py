@@ -4,171 +4,201 @@ import re
 import sys
 from pathlib import Path
 
-
-def validate_onboarding(content: str, allow_provenance: bool = False) -> list[str]:
-    errors = []
-    lines = content.splitlines()
-
-    # V1: Required headings must exist (exact) and in order
-    required_headings = [
-        "# ONBOARDING.md",
-        "## Overview",
-        "## Environment setup",
+REQUIRED_HEADINGS = [
+    "# ONBOARDING.md",
+    "## Overview",
+    "## Environment setup",
+    "## Install dependencies",
+    "## Run / develop locally",
+    "## Run tests",
+    "## Lint / format",
+    "## Dependency files detected",
+    "## Useful configuration files",
+    "## Useful docs",
+]
+
+COMMAND_SECTIONS = frozenset(
+    [
         "## Install dependencies",
         "## Run / develop locally",
         "## Run tests",
         "## Lint / format",
-        "## Dependency files detected",
-        "## Useful configuration files",
-        "## Useful docs",
     ]
-
-    found_headings = []
-    for line in lines:
-        if line.startswith("#"):
-            heading = line.strip()
-            if heading in required_headings:
-                found_headings.append(heading)
-            elif heading == "## Analyzer notes":
-                # Optional, don't check order here but check V6 later
-                continue
-
-    # Order check
-    if found_headings != required_headings:
-        missing = [h for h in required_headings if h not in found_headings]
-        if missing:
-            errors.append(f"V1: Missing required headings: {missing}")
-        else:
-            # Check for duplicates or wrong order
+)
+
+VENV_COMMANDS = ("python -m venv .venv", "python3 -m venv .venv")
+
+# How many lines below "## Overview" may hold the Repo path line (V2).
+REPO_PATH_WINDOW = 5
+# How many lines above a venv command may hold the "(Generic suggestion)" label (V4).
+VENV_LABEL_WINDOW = 3
+
+_REPO_PATH_RE = re.compile(r"^Repo path:\s+\S+")
+_BACKTICK_RE = re.compile(r"`[^`]+`")
+_CMD_START_RE = re.compile(
+    r"^(pip|python|make|tox|gh|npm|yarn|go|cargo|pytest|ruff|mypy|bash|sh|./)\b"
+)
+_DESC_RE = re.compile(r"(`[^`]+`)\s*(.*)")
+_EMPTY_RE = re.compile(r"\(empty\)", re.I)
+_PROV_RE = re.compile(r"\b(source|evidence):", re.I)
+
+
+def _check_command_bullet(i: int, stripped: str, errors: list[str]) -> None:
+    """V5: command bullets must be backticked and descriptions parenthesised."""
+    content_line = stripped.lstrip("*-").strip()
+    if not content_line or content_line == "No explicit commands detected.":
+        return
+
+    # Check for backticks
+    if not _BACKTICK_RE.search(content_line):
+        # Heuristic: if it looks like a command, it must be backticked
+        if _CMD_START_RE.match(content_line.lower()):
             errors.append(
-                f"V1: Headings out of order or duplicated. Expected: {required_headings}, Found: {found_headings}"
+                f"V5: Command on line {i + 1} must be wrapped in backticks: '{content_line}'"
             )
 
-    # V2: Repo path line must be present
-    overview_found = False
-    repo_path_found = False
-    for i, line in enumerate(lines):
-        if line.strip() == "## Overview":
-            overview_found = True
-            # Check next few lines for Repo path
-            for j in range(i + 1, min(i + 6, len(lines))):
-                if re.match(r"^Repo path:\s+\S+", lines[j].strip()):
-                    repo_path_found = True
-                    break
-                if lines[j].startswith("#"):  # Hit next heading
-                    break
-    if overview_found and not repo_path_found:
-        errors.append("V2: Missing or empty 'Repo path: <path>' line under ## Overview.")
+    # Check for description parentheses: `command` (Description.)
+    # Match backticked command and then check what's after it
+    match = _DESC_RE.search(content_line)
+    if match:
+        desc = match.group(2).strip()
+        if desc:
+            if not (desc.startswith("(") and desc.endswith(")")):
+                errors.append(f"V5: Description on line {i + 1} must be in parentheses: '{desc}'")
 
-    # V3: “No pin” phrasing must be exact and standalone
-    for i, line in enumerate(lines):
-        if "No Python version pin detected." in line:
-            if "Python version:" in line:
-                errors.append(
-                    f"V3: Forbidden pattern found on line {i + 1}: '{line.strip()}'. The phrase must be exact and standalone."
-                )
 
-    # V4: Venv snippet labeling
-    venv_commands = ["python -m venv .venv", "python3 -m venv .venv"]
-    for i, line in enumerate(lines):
-        if any(cmd in line for cmd in venv_commands):
-            # Check preceding 3 lines for (Generic suggestion)
-            label_found = False
-            for j in range(max(0, i - 3), i):
-                if "(Generic suggestion)" in lines[j]:
-                    label_found = True
-                    break
-            if not label_found:
-                errors.append(
-                    f"V4: Venv snippet found on line {i + 1} without '(Generic suggestion)' label within 3 lines above."
-                )
+def validate_onboarding(content: str, allow_provenance: bool = False) -> list[str]:
+    """
+    Validate ONBOARDING.md content against rules V1-V8.
+
+    All rules are evaluated in a single pass over the lines; per-rule state is carried
+    forward instead of re-scanning the document once per rule. Errors are still reported
+    grouped by rule (V1 first, V8 last), each group in line order.
+    """
+    lines = content.splitlines()
+
+    v3_errors: list[str] = []
+    v4_errors: list[str] = []
+    v5_errors: list[str] = []
+    v6_errors: list[str] = []
+    v8_errors: list[str] = []
+
+    found_headings: list[str] = []  # V1
+    overview_found = False  # V2
+    repo_path_found = False  # V2
+    repo_path_window = 0  # V2: lines left to search below the latest "## Overview"
+    last_label_line = -VENV_LABEL_WINDOW - 1  # V4: index of latest "(Generic suggestion)"
+    current_section: str | None = None  # V5
+    open_notes_sections: list[bool] = []  # V6: has-notes flag per open "## Analyzer notes"
+    install_section = False  # V7
+    pip_install_r_count = 0  # V7
 
-    # V5: Command formatting
-    command_sections = [
-        "## Install dependencies",
-        "## Run / develop locally",
-        "## Run tests",
-        "## Lint / format",
-    ]
-    current_section = None
     for i, line in enumerate(lines):
         stripped = line.strip()
-        if stripped in command_sections:
+        is_heading_line = line.startswith("#")
+
+        # V1: Required headings must exist (exact) and in order
+        if is_heading_line and stripped in REQUIRED_HEADINGS:
+            found_headings.append(stripped)
+
+        # V2: Repo path line must be present within a few lines of ## Overview
+        if repo_path_window:
+            repo_path_window -= 1
+            if _REPO_PATH_RE.match(stripped):
+                repo_path_found = True
+                repo_path_window = 0
+            elif is_heading_line:  # Hit next heading
+                repo_path_window = 0
+        if stripped == "## Overview":
+            overview_found = True
+            repo_path_window = REPO_PATH_WINDOW
+
+        # V3: "No pin" phrasing must be exact and standalone
+        if "No Python version pin detected." in line and "Python version:" in line:
+            v3_errors.append(
+                f"V3: Forbidden pattern found on line {i + 1}: '{stripped}'. The phrase must be exact and standalone."
+            )
+
+        # V4: Venv snippet labeling (label must be within the lines above)
+        if any(cmd in line for cmd in VENV_COMMANDS) and i - last_label_line > VENV_LABEL_WINDOW:
+            v4_errors.append(
+                f"V4: Venv snippet found on line {i + 1} without '(Generic suggestion)' label "
+                f"within {VENV_LABEL_WINDOW} lines above."
+            )
+        if "(Generic suggestion)" in line:
+            last_label_line = i
+
+        # V5: Command formatting
+        if stripped in COMMAND_SECTIONS:
             current_section = stripped
-        elif line.startswith("#"):
+        elif is_heading_line:
             current_section = None
+        if current_section and stripped.startswith(("*", "-")):
+            _check_command_bullet(i, stripped, v5_errors)
 
-        if current_section and (stripped.startswith("*") or stripped.startswith("-")):
-            content_line = stripped.lstrip("*-").strip()
-            if not content_line or content_line == "No explicit commands detected.":
-                continue
-
-            # Check for backticks
-            if not re.search(r"`[^`]+`", content_line):
-                # Heuristic: if it looks like a command, it must be backticked
-                if re.match(
-                    r"^(pip|python|make|tox|gh|npm|yarn|go|cargo|pytest|ruff|mypy|bash|sh|./)\b",
-                    content_line.lower(),
-                ):
-                    errors.append(
-                        f"V5: Command on line {i + 1} must be wrapped in backticks: '{content_line}'"
-                    )
-
-            # Check for description parentheses: `command` (Description.)
-            # Match backticked command and then check what's after it
-            match = re.search(r"(`[^`]+`)\s*(.*)", content_line)
-            if match:
-                desc = match.group(2).strip()
-                if desc:
-                    if not (desc.startswith("(") and desc.endswith(")")):
-                        errors.append(
-                            f"V5: Description on line {i + 1} must be in parentheses: '{desc}'"
-                        )
-
-    # V6: Analyzer notes section policy
-    for i, line in enumerate(lines):
-        if line.strip() == "## Analyzer notes":
-            has_notes = False
-            for j in range(i + 1, len(lines)):
-                if lines[j].startswith("#"):
-                    break
-                stripped_j = lines[j].strip()
-                if stripped_j.startswith(("*", "-")):
-                    note_content = stripped_j.lstrip("*-").strip()
-                    if note_content and not re.search(r"\(empty\)", note_content, re.I):
-                        has_notes = True
-                        break
-            if not has_notes:
-                errors.append(
+        # V6: Analyzer notes section policy
+        if open_notes_sections:
+            if is_heading_line:
+                v6_errors.extend(
                     "V6: ## Analyzer notes section exists but is empty or contains placeholder text."
+                    for has_notes in open_notes_sections
+                    if not has_notes
                 )
-
-    # V7: Install policy guard
-    install_section = False
-    pip_install_r_count = 0
-    for line in lines:
-        stripped = line.strip()
+                open_notes_sections = []
+            elif stripped.startswith(("*", "-")):
+                note_content = stripped.lstrip("*-").strip()
+                if note_content and not _EMPTY_RE.search(note_content):
+                    open_notes_sections = [True] * len(open_notes_sections)
+        if stripped == "## Analyzer notes":
+            open_notes_sections.append(False)
+
+        # V7: Install policy guard
         if stripped == "## Install dependencies":
             install_section = True
-        elif line.startswith("#") and stripped != "## Install dependencies":
+        elif is_heading_line:
             install_section = False
-
         if install_section and "pip install -r" in line:
             pip_install_r_count += 1
 
+        # V8: No provenance hidden (standard mode)
+        if not allow_provenance and _PROV_RE.search(line):
+            v8_errors.append(
+                f"V8: Provenance found on line {i + 1}: '{stripped}'. Provenance is forbidden in standard mode."
+            )
+
+    v6_errors.extend(
+        "V6: ## Analyzer notes section exists but is empty or contains placeholder text."
+        for has_notes in open_notes_sections
+        if not has_notes
+    )
+
+    errors: list[str] = []
+
+    # V1: Order check
+    if found_headings != REQUIRED_HEADINGS:
+        missing = [h for h in REQUIRED_HEADINGS if h not in found_headings]
+        if missing:
+            errors.append(f"V1: Missing required headings: {missing}")
+        else:
+            # Check for duplicates or wrong order
+            errors.append(
+                f"V1: Headings out of order or duplicated. Expected: {REQUIRED_HEADINGS}, Found: {found_headings}"
+            )
+
+    if overview_found and not repo_path_found:
+        errors.append("V2: Missing or empty 'Repo path: <path>' line under ## Overview.")
+
+    errors.extend(v3_errors)
+    errors.extend(v4_errors)
+    errors.extend(v5_errors)
+    errors.extend(v6_errors)
+
     if pip_install_r_count > 1:
         errors.append(
             f"V7: Multiple 'pip install -r' lines found ({pip_install_r_count}). Max 1 allowed unless explicitly detected."
         )
 
-    # V8: No provenance hidden (standard mode)
-    if not allow_provenance:
-        for i, line in enumerate(lines):
-            if re.search(r"\b(source|evidence):", line, re.I):
-                errors.append(
-                    f"V8: Provenance found on line {i + 1}: '{line.strip()}'. Provenance is forbidden in standard mode."
-                )
-
+    errors.extend(v8_errors)
     return errors
 
 
@@ -1,17 +1,26 @@
+import heapq
 import logging
-import re
-from collections.abc import Callable
+import os
+import sys
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from ..config import (
-    CONFIG_FILE_TYPES,
     DEFAULT_MAX_FILES,
+    DEPENDENCY_PREFIXES,
+    DEPENDENCY_SUFFIXES,
     DOC_EXCLUDED_EXTENSIONS,
     DOC_HUMAN_EXTENSIONS,
+    FILE_KINDS,
     MAX_CONFIG_CAP,
     MAX_DOCS_CAP,
     SAFETY_IGNORES,
+    WORKFLOW_SUFFIXES,
+    WORKFLOWS_PREFIX,
+    classify_filename,
+    is_workflow_file,
 )
 from ..describers import FILE_DESCRIBER_REGISTRY
 from ..effective_config import EffectiveConfig
@@ -26,7 +35,6 @@ from ..schema import (
     TestSetup,
     ToolingEvidence,
 )
-from .catalog import is_dependency_file
 from .extractors import (
     detect_workflow_python_version,
     extract_makefile_commands,
@@ -35,27 +43,91 @@ from .extractors import (
     extract_shell_scripts,
     extract_tox_commands,
 )
+from .file_cache import memoize_file_load
 from .frameworks import detect_frameworks
 from .install_commands import merge_python_install_instructions_into_scripts
 from .notebook_hygiene import precommit_has_notebook_hygiene
 from .prioritization import get_config_priority, get_dep_priority, get_doc_priority
-from .scanning import scan_repo_files
+from .scanning import list_dir_sorted, scan_repo_files
 from .structs import IgnoreMatcher
-from .tooling import detect_other_tooling
+from .tooling import detect_other_tooling, index_basenames
 
 logger = logging.getLogger(__name__)
 
+# Prefix/suffix tuples are passed straight to str.startswith/endswith (one C-level call each).
+_DOC_NAME_PREFIXES = ("readme", "contributing", "license", "security")
+_TOP_LEVEL_DOC_PREFIXES = ("readme", "contributing")
+
+# Cheap pre-filter for _categorize_files: a file can only be a doc/config/dependency if its
+# basename starts with one of these characters (derived from the rule tables, so it cannot
+# drift) or it lives under one of the path-based roots. Everything else is skipped outright.
+_CATEGORY_NAME_FIRST_CHARS = frozenset(
+    n[0] for n in (*FILE_KINDS, *DEPENDENCY_PREFIXES, *_DOC_NAME_PREFIXES)
+)
+_CATEGORY_PATH_PREFIXES = ("docs/", WORKFLOWS_PREFIX)
+
+# Repo-level ignore files, lowest precedence first.
+_IGNORE_FILES = (".git/info/exclude", ".gitignore")
+# Ignore-file contents kept across calls (caching policy: see file_cache).
+_IGNORE_FILE_CACHE_SIZE = 128
+
+_PRECOMMIT_CONFIG_NAMES = (".pre-commit-config.yaml", ".pre-commit-config.yml")
+
+# Manifests (lowercase basenames) that imply pip as a package manager.
+_PIP_MANIFEST_NAMES = frozenset({"setup.py", "setup.cfg", "pyproject.toml"})
+
+# Root files the targeted scan always reports, even when .gitignore hides them.
+_TARGETED_ROOT_FILES = frozenset(
+    {
+        "pyproject.toml",
+        "tox.ini",
+        "noxfile.py",
+        "setup.py",
+        "setup.cfg",
+        "Makefile",
+        ".pre-commit-config.yaml",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _FileCandidate:
+    """A categorized doc/config file, materialized into a schema model only if it survives the cap."""
+
+    path: str
+    type: str
+
+
+def _read_ignore_file(path: Path, label: str) -> tuple[str, ...]:
+    # EAFP: a missing file costs the single failed stat, not an is_file() check plus a stat.
+    try:
+        return _read_ignore_lines(path)
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return ()
+    except OSError as e:
+        logger.warning(f"Failed to read {label} at {path}: {e}")
+        return ()
+
+
+@memoize_file_load(maxsize=_IGNORE_FILE_CACHE_SIZE)
+def _read_ignore_lines(path: Path) -> tuple[str, ...]:
+    """Read an ignore file's lines; memoized across analyze_repo calls (see file_cache)."""
+    return tuple(path.read_text(encoding="utf-8", errors="ignore").splitlines())
 
-def _setup_ignore_matcher(root: Path) -> IgnoreMatcher:
-    gitignore_patterns = []
-    gitignore = root / ".gitignore"
-    if gitignore.is_file():
-        try:
-            with open(gitignore, encoding="utf-8") as f:
-                gitignore_patterns.extend(f.readlines())
-        except OSError as e:
-            logger.warning(f"Failed to read .gitignore at {gitignore}: {e}")
-            pass
+
+def _setup_ignore_matcher(
+    root: Path, root_entries: list[os.DirEntry[str]] | None = None
+) -> IgnoreMatcher:
+    # When the root listing is available it rules out absent files without any syscall.
+    root_names = None if root_entries is None else {e.name for e in root_entries}
+
+    gitignore_patterns: list[str] = []
+    # Same precedence as git: .git/info/exclude first, so .gitignore rules (read later)
+    # win when pathspec applies last-match-wins.
+    for rel in _IGNORE_FILES:
+        if root_names is not None and rel.partition("/")[0] not in root_names:
+            continue
+        gitignore_patterns.extend(_read_ignore_file(root / rel, rel))
 
     return IgnoreMatcher(
         repo_root=root,
@@ -64,70 +136,133 @@ def _setup_ignore_matcher(root: Path) -> IgnoreMatcher:
     )
 
 
-def _perform_targeted_scan(root: Path, safety_ignores: list[str] | tuple[str, ...]) -> list[str]:
+def _perform_targeted_scan(
+    root: Path,
+    safety_ignores: list[str] | tuple[str, ...],
+    root_entries: list[os.DirEntry[str]] | None = None,
+    already_found: Collection[str] = (),
+) -> list[str]:
+    """
+    Return the key project files the broad scan may have missed (e.g. gitignored ones).
+
+    Files in `already_found` are skipped without any syscall, and a prefetched root listing
+    answers the root-level lookups, so only the workflows directory is listed here.
+    """
     targeted_files = []
     # Targeted scan should bypass .gitignore but respect safety ignores
     safety_only_ignore = IgnoreMatcher(
         repo_root=root, safety_ignores=list(safety_ignores), gitignore_patterns=[]
     )
 
-    for pattern in [
-        "pyproject.toml",
-        "tox.ini",
-        "noxfile.py",
-        "setup.py",
-        "setup.cfg",
-        "Makefile",
-        ".pre-commit-config.yaml",
-    ]:
-        p = root / pattern
-        if p.is_file() and not safety_only_ignore.should_ignore(p):
-            targeted_files.append(p.name)
-
-    for pattern in ["requirements*.txt", ".github/workflows/*.yml"]:
-        for p in root.glob(pattern):
-            if p.is_file() and not safety_only_ignore.should_ignore(p):
-                targeted_files.append(str(p.relative_to(root)))
+    if root_entries is None:
+        try:
+            root_entries = list_dir_sorted(root)
+        except OSError:
+            root_entries = []
+
+    for e in root_entries:
+        name = e.name
+        if name in already_found:
+            continue
+        if (
+            (name in _TARGETED_ROOT_FILES or _is_requirements_name(name))
+            and e.is_file()
+            and not safety_only_ignore.should_ignore(Path(e.path))
+        ):
+            targeted_files.append(name)
+
+    # One scandir for the workflows directory instead of pathlib's glob machinery.
+    targeted_files += _list_targeted_files(
+        root, WORKFLOWS_PREFIX.rstrip("/"), is_workflow_file, safety_only_ignore, already_found
+    )
     return targeted_files
 
 
-def _is_workflow_file(rel_path: str) -> bool:
-    """
-    GitHub Actions workflow file detection (repo-relative POSIX path).
-    """
-    p = rel_path.replace("\\", "/")
-    if not p.startswith(".github/workflows/"):
-        return False
-    lower = p.lower()
-    return lower.endswith(".yml") or lower.endswith(".yaml")
+def _is_requirements_name(name: str) -> bool:
+    return name.startswith("requirements") and name.endswith(DEPENDENCY_SUFFIXES)
 
 
-def _categorize_files(
+def _list_targeted_files(
     root: Path,
+    rel_dir: str,
+    keep: Callable[[str], bool],
+    ignore: IgnoreMatcher,
+    already_found: Collection[str] = (),
+) -> list[str]:
+    """Return repo-relative paths of the files in root/rel_dir whose path passes `keep`."""
+    try:
+        entries = list_dir_sorted(root / rel_dir)
+    except OSError:
+        return []  # missing directory (e.g. no .github/workflows)
+
+    prefix = f"{rel_dir}/" if rel_dir else ""
+    found = []
+    for e in entries:
+        rel_path = prefix + e.name
+        if (
+            rel_path not in already_found
+            and keep(rel_path)
+            and e.is_file()
+            and not ignore.should_ignore(Path(e.path))
+        ):
+            found.append(rel_path)
+    return found
+
+
+def _name_suffix(name: str) -> str:
+    """Return the final suffix of a basename, with the same rules as PurePath.suffix."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
+def _categorize_files(
     all_files: list[str],
-) -> tuple[list[DocInfo], list[ConfigFileInfo], list[PythonEnvFile], list[str]]:
-    docs = []
-    configs = []
+    basenames: list[str] | None = None,
+    notebook_dirs: set[str] | None = None,
+) -> tuple[list[_FileCandidate], list[_FileCandidate], list[PythonEnvFile], list[str]]:
+    """
+    Split all_files into doc/config candidates and described dependency files.
+
+    `basenames` (lowercase, aligned with all_files) may be passed in when the caller
+    already has them. When `notebook_dirs` is given, the directories holding .ipynb files
+    ("." for the root, otherwise "<dir>/") are added to it in the same pass.
+    """
+    # Docs and configs are only recorded here; their models (and config describers, which may
+    # read the file) are built in _prioritize_and_cap for the entries that survive the caps.
+    docs: list[_FileCandidate] = []
+    configs: list[_FileCandidate] = []
     dep_files = []
     notes: list[str] = []
 
-    for f_path in all_files:
-        # f_path is expected to be repo-relative with "/" separators, but normalize defensively.
-        f_path = f_path.replace("\\", "/").lstrip("/")
-        name = Path(f_path).name.lower()
+    if basenames is None:
+        # Basename via string split: avoids building a Path for every scanned file.
+        basenames = [f.rpartition("/")[2].lower() for f in all_files]
+
+    # The pre-filter runs for every file; bind its tables to locals (LOAD_FAST in the loop).
+    first_chars = _CATEGORY_NAME_FIRST_CHARS
+    path_prefixes = _CATEGORY_PATH_PREFIXES
+
+    # f_path is repo-relative with "/" separators: scan_repo_files and the targeted scan
+    # normalize once at the source, so no per-file rewrite is needed here.
+    for f_path, name in zip(all_files, basenames, strict=True):
+        if notebook_dirs is not None and name.endswith(".ipynb"):
+            parent, sep, _ = f_path.rpartition("/")
+            notebook_dirs.add(f"{parent}/" if sep else ".")
+            # No `continue`: a notebook can still be a doc (e.g. README.ipynb).
+
+        if name[:1] not in first_chars and not f_path.startswith(path_prefixes):
+            continue
 
         # Docs
-        is_doc_candidate = name.startswith(
-            ("readme", "contributing", "license", "security")
-        ) or f_path.startswith("docs/")
+        is_doc_candidate = name.startswith(_DOC_NAME_PREFIXES) or f_path.startswith("docs/")
 
         if is_doc_candidate:
-            suffix = Path(f_path).suffix.lower()
+            suffix = _name_suffix(name)
 
             # Exception: Always include top-level README/CONTRIBUTING regardless of extension
-            is_top_level_readme = (
-                name.startswith("readme") or name.startswith("contributing")
-            ) and "/" not in f_path
+            is_top_level_readme = name.startswith(_TOP_LEVEL_DOC_PREFIXES) and "/" not in f_path
 
             if not is_top_level_readme:
                 # Rule A: Exclude binary/asset extensions entirely
@@ -139,82 +274,114 @@ def _categorize_files(
                     if suffix not in DOC_HUMAN_EXTENSIONS:
                         continue
 
-            docs.append(DocInfo(path=f_path, type="doc"))
+            docs.append(_FileCandidate(f_path, "doc"))
             continue
 
+        # One classification serves both the dependency and the named-config checks.
+        category = classify_filename(name)
+
         # Dependencies
-        is_dep = is_dependency_file(f_path)
-        if is_dep:
+        if category == "dependency":
             desc_key = "requirements.txt" if name.startswith("requirements") else name
             dep_describer = FILE_DESCRIBER_REGISTRY.get(desc_key)
-            dep_file = PythonEnvFile(path=f_path, type=name)
+            # Type strings repeat across files (many "requirements.txt", "tox.ini", ...);
+            # intern them so models share one string object per name.
+            dep_file = PythonEnvFile(path=f_path, type=sys.intern(name))
             if dep_describer:
                 dep_file = dep_describer.describe(dep_file)
             dep_files.append(dep_file)
             continue
 
         # Config files (classification MUST NOT depend on describer presence)
-        is_workflow = _is_workflow_file(f_path)
-        is_named_config = name in CONFIG_FILE_TYPES
+        # Same test as is_workflow_file, reusing the already-lowered basename.
+        is_workflow = f_path.startswith(WORKFLOWS_PREFIX) and name.endswith(WORKFLOW_SUFFIXES)
+        is_named_config = category == "config"
 
         if is_workflow or is_named_config:
-            config_file = ConfigFileInfo(path=f_path, type=name)
+            configs.append(_FileCandidate(f_path, sys.intern(name)))
 
-            # Enrichment only (optional descriptions)
-            describer = None
-            if is_workflow:
-                describer = FILE_DESCRIBER_REGISTRY.get(".github/workflows")
-            else:
-                describer = FILE_DESCRIBER_REGISTRY.get(name)
+    # Sort dependency files deterministically
+    dep_files.sort(key=lambda x: (-get_dep_priority(x.path), x.path))
 
-            if describer:
-                config_file = describer.describe(config_file)
+    return docs, configs, dep_files, notes
 
-            # P7-02: Notebook hygiene detection in pre-commit config
-            # Acceptance: if nbstripout/nb-clean/jupyter-notebook-cleanup is found,
-            # override the description with the required text.
-            if name in (".pre-commit-config.yaml", ".pre-commit-config.yml"):
-                if precommit_has_notebook_hygiene(root, f_path):
-                    config_file.description = "Pre-commit config for cleaning Jupyter notebooks (e.g. stripping outputs) for cleaner diffs."
 
-            configs.append(config_file)
+def sort_by_score_then_path(
+    items: list[Any], score_fn: Callable[[str], int], limit: int | None = None
+) -> list[Any]:
+    """
+    Sort items by score (descending) then path (ascending).
 
-    # Sort dependency files deterministically
-    dep_files.sort(key=lambda x: (-get_dep_priority(x.path), x.path))
+    If limit is given, only the first `limit` items of that order are returned.
+    A bounded heap selection is used when truncating, so the full list is never sorted.
+    """
 
-    return docs, configs, dep_files, notes
+    def key(x: Any) -> tuple[int, str]:
+        return (-score_fn(x.path), x.path)
+
+    if limit is not None and len(items) > limit:
+        return heapq.nsmallest(limit, items, key=key)
+    return sorted(items, key=key)
 
 
-def sort_by_score_then_path(items: list[Any], score_fn: Callable[[str], int]) -> list[Any]:
-    """Sort items by score (descending) then path (ascending)."""
-    return sorted(items, key=lambda x: (-score_fn(x.path), x.path))
+def _describe_config(root: Path, candidate: _FileCandidate) -> ConfigFileInfo:
+    config_file = ConfigFileInfo(path=candidate.path, type=candidate.type)
+
+    # Enrichment only (optional descriptions)
+    if is_workflow_file(candidate.path):
+        describer = FILE_DESCRIBER_REGISTRY.get(".github/workflows")
+    else:
+        describer = FILE_DESCRIBER_REGISTRY.get(candidate.type)
+
+    if describer:
+        config_file = describer.describe(config_file)
+
+    # P7-02: Notebook hygiene detection in pre-commit config
+    # Acceptance: if nbstripout/nb-clean/jupyter-notebook-cleanup is found,
+    # override the description with the required text.
+    if candidate.type in _PRECOMMIT_CONFIG_NAMES:
+        if precommit_has_notebook_hygiene(root, candidate.path):
+            config_file.description = "Pre-commit config for cleaning Jupyter notebooks (e.g. stripping outputs) for cleaner diffs."
+
+    return config_file
 
 
 def _prioritize_and_cap(
-    docs: list[DocInfo], configs: list[ConfigFileInfo]
+    root: Path, docs: list[_FileCandidate], configs: list[_FileCandidate]
 ) -> tuple[list[DocInfo], list[ConfigFileInfo], list[str]]:
     notes = []
-    docs = sort_by_score_then_path(docs, get_doc_priority)
-    if len(docs) > MAX_DOCS_CAP:
-        total = len(docs)
+    total = len(docs)
+    capped_docs = sort_by_score_then_path(docs, get_doc_priority, limit=MAX_DOCS_CAP)
+    if total > MAX_DOCS_CAP:
         notes.append(f"docs list truncated to {MAX_DOCS_CAP} entries (total={total})")
-        docs = docs[:MAX_DOCS_CAP]
 
-    configs = sort_by_score_then_path(configs, get_config_priority)
-    if len(configs) > MAX_CONFIG_CAP:
-        total = len(configs)
+    total = len(configs)
+    capped_configs = sort_by_score_then_path(configs, get_config_priority, limit=MAX_CONFIG_CAP)
+    if total > MAX_CONFIG_CAP:
         notes.append(
             f"configurationFiles list truncated to {MAX_CONFIG_CAP} entries (total={total})"
         )
-        configs = configs[:MAX_CONFIG_CAP]
-    return docs, configs, notes
+
+    # Build models only for the capped entries: at most MAX_DOCS_CAP + MAX_CONFIG_CAP.
+    doc_infos = [DocInfo(path=c.path, type=c.type) for c in capped_docs]
+    config_infos = [_describe_config(root, c) for c in capped_configs]
+    return doc_infos, config_infos, notes
 
 
 def _aggregate_scripts(
     root: Path, configs: list[ConfigFileInfo], all_files: list[str]
 ) -> RepoAnalysisScriptGroup:
     scripts = RepoAnalysisScriptGroup()
-    makefile = next((c.path for c in configs if Path(c.path).name.lower() == "makefile"), None)
+    # ConfigFileInfo.type is the lowercased basename recorded during categorization, so
+    # look files up by it instead of rebuilding a Path per config. One pass finds the first
+    # (highest-priority) Makefile and tox.ini.
+    makefile = tox_ini = None
+    for c in configs:
+        if c.type == "makefile" and makefile is None:
+            makefile = c.path
+        elif c.type == "tox.ini" and tox_ini is None:
+            tox_ini = c.path
+
     if makefile:
         mk_cmds = extract_makefile_commands(root, makefile)
         for category, cmd_list in mk_cmds.items():
@@ -225,7 +392,6 @@ def _aggregate_scripts(
     scripts.dev.extend(sh_cmds["dev"])
     scripts.test.extend(sh_cmds["test"])
 
-    tox_ini = next((c.path for c in configs if Path(c.path).name.lower() == "tox.ini"), None)
     if tox_ini:
         tox_cmds = extract_tox_commands(root, tox_ini)
         scripts.test.extend(tox_cmds["test"])
@@ -246,8 +412,12 @@ def _infer_python_environment(
         "package_managers": [],
         "build_backend": None,
     }
+    # One basename pass over dep_files answers every manifest check below.
+    dep_names = [d.path.rpartition("/")[2] for d in dep_files]
+    dep_names_lower = {n.lower() for n in dep_names}
     pyproject_file = next(
-        (d.path for d in dep_files if Path(d.path).name == "pyproject.toml"), None
+        (d.path for d, n in zip(dep_files, dep_names, strict=True) if n == "pyproject.toml"),
+        None,
     )
     if pyproject_file:
         pyproject_metadata = extract_pyproject_metadata(root, pyproject_file)
@@ -262,25 +432,19 @@ def _infer_python_environment(
         or pyproject_metadata["python_version"]
     ):
         package_managers: list[str] = list(pyproject_metadata["package_managers"])
-        if any(d.path.startswith("requirements") for d in dep_files) or any(
-            Path(d.path).name.lower() in ["setup.py", "setup.cfg", "pyproject.toml"]
-            for d in dep_files
-        ):
+        reqs = [d.path for d in dep_files if d.path.startswith("requirements")]
+        if reqs or not dep_names_lower.isdisjoint(_PIP_MANIFEST_NAMES):
             if "pip" not in package_managers:
                 package_managers.append("pip")
 
         env_setup_instructions: list[str] = []
         install_instructions = []
 
-        has_pyproject = any(Path(d.path).name.lower() == "pyproject.toml" for d in dep_files)
-        has_setup_py = any(Path(d.path).name.lower() == "setup.py" for d in dep_files)
-
-        if has_pyproject:
+        if "pyproject.toml" in dep_names_lower:
             install_instructions.append("pip install .")
-        elif has_setup_py:
+        elif "setup.py" in dep_names_lower:
             install_instructions.append("pip install -e .")
         elif "pip" in package_managers:
-            reqs = [d.path for d in dep_files if d.path.startswith("requirements")]
             if reqs:
                 main_req = next((r for r in reqs if r == "requirements.txt"), reqs[0])
                 install_instructions.append(f"pip install -r {main_req}")
@@ -338,25 +502,57 @@ def analyze_repo(
 
     root = Path(repo_path).resolve()
 
-    ignore = _setup_ignore_matcher(root)
-
-    # 1. Targeted scan
-    targeted_files = _perform_targeted_scan(root, effective_config.safety_ignores)
-
-    # 2. Broad scan
-    all_other_files, py_files = scan_repo_files(root, ignore, max_files)
+    # List the root once: it answers the .gitignore lookup and seeds the broad scan.
+    # A missing, unreadable or empty root has nothing to analyze: skip the whole pipeline.
+    try:
+        root_entries = list_dir_sorted(root)
+    except OSError as e:
+        logger.warning(f"Error scanning directory {root}: {e}")
+        if isinstance(e, (FileNotFoundError, NotADirectoryError)):
+            return _empty_analysis(root, ["Repository path not found or not a directory."])
+        return _empty_analysis(root, ["Repository path could not be read."])
+    if not root_entries:
+        logger.info(f"Analyzed repo at {root}: 0 files found.")
+        return _empty_analysis(root, [])
+
+    ignore = _setup_ignore_matcher(root, root_entries)
+
+    # 1. Broad scan
+    all_other_files, py_files = scan_repo_files(root, ignore, max_files, root_entries)
+
+    # 2. Targeted scan
+    # Only files the broad scan did not already report (gitignored or past max_files) are
+    # probed; the root listing is reused, so this costs one scandir of .github/workflows.
+    found = set(all_other_files)
+    targeted_files = _perform_targeted_scan(
+        root, effective_config.safety_ignores, root_entries, found
+    )
 
     # 3. Combine
-    all_files = sorted(set(all_other_files + targeted_files))
+    # Both lists hold unique paths and the targeted scan skipped everything in `found`, so
+    # they are disjoint: concatenate and sort in place, no dedup pass. The lexical sort
+    # stays: shell-script commands, notebook directories and tooling evidence are emitted in
+    # all_files order.
+    all_files = all_other_files + targeted_files
+    all_files.sort()
+
+    # One basename pass over all_files, shared by categorization, notebook detection and
+    # both tooling detectors.
+    basenames = [f.rpartition("/")[2].lower() for f in all_files]
+    basename_index = index_basenames(all_files, basenames)
 
     # Compute primary tooling (Phase 10 - #124)
-    primary_tooling = _compute_primary_tooling_from_files(all_files)
+    primary_tooling = _compute_primary_tooling_from_files(all_files, basename_index.keys())
 
     # 4. Categorize
-    docs, configs, dep_files, cat_notes = _categorize_files(root, all_files)
+    # (Notebook directories for step 8 are collected in the same pass.)
+    notebook_dirs: set[str] = set()
+    doc_candidates, config_candidates, dep_files, cat_notes = _categorize_files(
+        all_files, basenames, notebook_dirs
+    )
 
     # 5. Prioritize & Cap
-    docs, configs, cap_notes = _prioritize_and_cap(docs, configs)
+    docs, configs, cap_notes = _prioritize_and_cap(root, doc_candidates, config_candidates)
     notes = cat_notes + cap_notes
 
     # 6. Extract Scripts
@@ -379,26 +575,13 @@ def analyze_repo(
                 getattr(scripts, group).extend(cmd_list)
 
     # 8. Notebook Detection (P7-01 / Issue #60)
-    notebook_dirs = set()
-    for f_path in all_files:
-        if f_path.lower().endswith(".ipynb"):
-            # If at root, use '.', otherwise parent directory
-            rel_dir = str(Path(f_path).parent)
-            if rel_dir == ".":
-                notebook_dirs.add(".")
-            else:
-                posix_dir = rel_dir.replace("\\", "/")
-                # Ensure trailing slash for directories
-                if not posix_dir.endswith("/"):
-                    posix_dir += "/"
-                notebook_dirs.add(posix_dir)
-
+    # Root notebooks are reported as ".", others by parent directory with a trailing slash.
     notebooks_field = sorted(notebook_dirs)
     if notebooks_field:
         notes.append("Notebook-centric repo detected; core logic may reside in Jupyter notebooks.")
 
     # 9. Other tooling detection (Phase 8 - #81)
-    other_tooling_detections = detect_other_tooling(all_files)
+    other_tooling_detections = detect_other_tooling(all_files, basename_index)
     other_tooling = [
         ToolingEvidence(
             name=d.name,
@@ -426,10 +609,25 @@ def analyze_repo(
     )
 
 
-def _compute_primary_tooling_from_files(all_files: list[str]) -> str:
+def _empty_analysis(root: Path, notes: list[str]) -> RepoAnalysis:
+    """Return the report analyze_repo produces for a repository with no files."""
+    return RepoAnalysis(
+        repoPath=str(root),
+        primaryTooling="Unknown",
+        notes=notes,
+        projectLayout=ProjectLayout(),
+        testSetup=TestSetup(),
+    )
+
+
+def _compute_primary_tooling_from_files(
+    all_files: list[str], basenames: Collection[str] | None = None
+) -> str:
     """
     Deterministic, evidence-only primary tooling computation.
 
+    `basenames` (lowercase file names) may be passed in when the caller already has them.
+
     Values: "Python", "Node.js", or "Unknown".
     Tie-break: Python wins ties.
 
@@ -440,10 +638,9 @@ def _compute_primary_tooling_from_files(all_files: list[str]) -> str:
     if not all_files:
         return "Unknown"
 
-    # Normalize to basenames (repo-relative, case-insensitive)
-    basenames: set[str] = {
-        Path(p.replace("\\", "/")).name.lower() for p in all_files if isinstance(p, str)
-    }
+    # Normalize to basenames (repo-relative, case-insensitive) unless the caller has them
+    if basenames is None:
+        basenames = {p.rpartition("/")[2].lower() for p in all_files if isinstance(p, str)}
 
     # Evidence patterns with scores
     python_patterns = [
@@ -484,6 +681,7 @@ def _is_exact_version(v: str) -> bool:
     Check if a version string is an exact version (X.Y or X.Y.Z) and not a range.
     Matches digits only separated by dots.
     """
-    if not v:
-        return False
-    return bool(re.match(r"^\d+\.\d+(\.\d+)?$", v))
+    # str.split + isdecimal (which, like \d, accepts only decimal digits) instead of a regex:
+    # hints are a few characters long, so the re dispatch would dominate.
+    parts = v.split(".")
+    return len(parts) in (2, 3) and all(p.isdecimal() for p in parts)  # X.Y or X.Y.Z
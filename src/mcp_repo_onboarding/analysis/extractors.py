@@ -1,18 +1,54 @@
+import itertools
 import json
 import logging
+import os
 import re
 import tomllib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from ..config import KNOWN_PACKAGE_MANAGERS
+from ..config import KNOWN_PACKAGE_MANAGERS, WORKFLOWS_PREFIX, is_workflow_file
 from ..describers import COMMAND_DESCRIBER_REGISTRY
 from ..schema import CommandInfo
+from .file_cache import memoize_file_load
 
 logger = logging.getLogger(__name__)
 
+# Makefile rule header ("target [target ...]:") at the start of a line. Compiled once and run
+# over the raw bytes with finditer, so the file is neither fully decoded nor split into lines.
+# Whitespace between targets is [ \t] (not \s) so a match can never span a newline.
+_MAKE_TARGET_RE = re.compile(rb"(?m)^([a-zA-Z0-9_-]+(?:[ \t]+[a-zA-Z0-9_-]+)*):")
+
+# Python versions pinned in GitHub Actions workflows (env var / setup-python input), as one
+# alternation so each workflow is scanned once.
+_WORKFLOW_PY_VERSION_RE = re.compile(r'(?:PYTHON_VERSION|python-version):\s*["\\]?([\d\.]+)["\\]?')
+
+# Makefile target -> script category.
+_MAKE_TARGET_CATEGORIES: dict[str, str] = {
+    "test": "test",
+    "lint": "lint",
+    "format": "format",
+    "dev": "dev",
+    "install": "install",
+    "run": "start",
+    "start": "start",
+    "check": "test",
+}
+
+# Deterministic fallback descriptions, grounded in Makefile target existence (not invented
+# behavior). Targets without an entry get a generic "Run Makefile target '<name>'." text.
+_MAKE_FALLBACK_DESCRIPTIONS: dict[str, str] = {
+    "install": "Install dependencies via Makefile target.",
+    "test": "Run the test suite via Makefile target.",
+    "lint": "Run linting via Makefile target.",
+    "format": "Run formatting via Makefile target.",
+    "run": "Run the application via Makefile target.",
+    "start": "Run the application via Makefile target.",
+}
+
 
 def extract_makefile_commands(root: Path, makefile_path: str) -> dict[str, list[CommandInfo]]:
     """
@@ -27,63 +63,41 @@ def extract_makefile_commands(root: Path, makefile_path: str) -> dict[str, list[
     """
     commands: dict[str, list[CommandInfo]] = {}
     try:
-        content = (root / makefile_path).read_text(encoding="utf-8", errors="ignore")
+        content = (root / makefile_path).read_bytes()
     except OSError as e:
         logger.warning(f"Failed to read Makefile at {makefile_path}: {e}")
         return {}
 
-    target_pattern = re.compile(r"^([a-zA-Z0-9_-]+(?:\s+[a-zA-Z0-9_-]+)*):")
-
-    def _fallback_make_desc(target: str) -> str:
-        # Deterministic, grounded in Makefile target existence (not invented behavior).
-        if target == "install":
-            return "Install dependencies via Makefile target."
-        if target == "test":
-            return "Run the test suite via Makefile target."
-        if target == "lint":
-            return "Run linting via Makefile target."
-        if target == "format":
-            return "Run formatting via Makefile target."
-        if target in ("run", "start"):
-            return "Run the application via Makefile target."
-        return f"Run Makefile target '{target}'."
-
-    target_mapping = {
-        "test": "test",
-        "lint": "lint",
-        "format": "format",
-        "dev": "dev",
-        "install": "install",
-        "run": "start",
-        "start": "start",
-        "check": "test",
-    }
-
-    for line in content.splitlines():
-        match = target_pattern.match(line)
-        if match:
-            targets_str = match.group(1)
-            targets = targets_str.split()
-            for target in targets:
-                if target in target_mapping:
-                    category = target_mapping[target]
-                    command_str = f"make {target}"
-                    cmd_info = CommandInfo(command=command_str, source=f"{makefile_path}:{target}")
-
-                    if command_str in COMMAND_DESCRIBER_REGISTRY:
-                        cmd_info = COMMAND_DESCRIBER_REGISTRY[command_str].describe(cmd_info)
-
-                    # Ensure Makefile-derived commands always have a description to prevent LLM drift
-                    # (keeps ONBOARDING compliant with the "command bullets always include (Description.)" prompt rule).
-                    if not cmd_info.description:
-                        cmd_info.description = _fallback_make_desc(target)
-
-                    if category not in commands:
-                        commands[category] = []
-                    commands[category].append(cmd_info)
+    for match in _MAKE_TARGET_RE.finditer(content):
+        # The pattern only admits ASCII, so decoding the matched group cannot fail.
+        for target in match.group(1).decode("ascii").split():
+            category = _MAKE_TARGET_CATEGORIES.get(target)
+            if category is not None:
+                command_str = f"make {target}"
+                cmd_info = CommandInfo(command=command_str, source=f"{makefile_path}:{target}")
+
+                if command_str in COMMAND_DESCRIBER_REGISTRY:
+                    cmd_info = COMMAND_DESCRIBER_REGISTRY[command_str].describe(cmd_info)
+
+                # Ensure Makefile-derived commands always have a description to prevent LLM drift
+                # (keeps ONBOARDING compliant with the "command bullets always include (Description.)" prompt rule).
+                if not cmd_info.description:
+                    cmd_info.description = _MAKE_FALLBACK_DESCRIPTIONS.get(
+                        target, f"Run Makefile target '{target}'."
+                    )
+
+                if category not in commands:
+                    commands[category] = []
+                commands[category].append(cmd_info)
     return commands
 
 
+# Characters counted as decoration when judging a comment line (e.g. "# ---- === ----").
+_DESC_SEPARATOR_DELETE = str.maketrans("", "", " -_=#")
+# Single-word comments that label a section rather than describe the script.
+_DESC_PLACEHOLDER_WORDS = frozenset({"CONFIG", "SETUP", "MAIN", "TEST", "BUILD", "START", "END"})
+
+
 def _is_safe_description(line: str) -> bool:
     """Check if a comment line is a safe, non-command-like description."""
     line = line.strip()
@@ -98,15 +112,16 @@ def _is_safe_description(line: str) -> bool:
     if line.startswith(("cd ", "bash ", "python ", "make ")):
         return False
 
-    separators = " -_=#"
-    separator_count = sum(c in separators for c in line)
+    # Separators are deleted in one C-level translate pass; the length difference is
+    # the separator count.
     total_chars = len(line)
+    separator_count = total_chars - len(line.translate(_DESC_SEPARATOR_DELETE))
 
     if total_chars > 4 and (separator_count / total_chars) > 0.5:
         return False
 
     if len(line.split()) < 2:
-        if line.upper() in ["CONFIG", "SETUP", "MAIN", "TEST", "BUILD", "START", "END"]:
+        if line.upper() in _DESC_PLACEHOLDER_WORDS:
             return False
 
     return True
@@ -114,23 +129,26 @@ def _is_safe_description(line: str) -> bool:
 
 _HELPER_SCRIPT_DESC = "Helper script used by other repo scripts."
 
+# Header comment lines inspected per script; real shebang/description blocks are far shorter.
+_SCRIPT_HEADER_MAX_LINES = 50
+
+
+# Basenames (lowercase) of shared helper scripts, and the prefixes that mark one.
+_HELPER_SCRIPT_NAMES = frozenset(
+    {"helper.sh", "helpers.sh", "util.sh", "utils.sh", "common.sh", "shared.sh"}
+)
+_HELPER_SCRIPT_PREFIXES = ("helper", "helpers", "util", "utils", "common", "shared")
+
 
 def _is_helper_script(script_rel_path: str) -> bool:
-    name = Path(script_rel_path).name.lower()
-
-    helper_exact = {
-        "helper.sh",
-        "helpers.sh",
-        "util.sh",
-        "utils.sh",
-        "common.sh",
-        "shared.sh",
-    }
-    helper_prefixes = ("helper", "helpers", "util", "utils", "common", "shared")
+    return _is_helper_script_name(script_rel_path.rpartition("/")[2].lower())
 
+
+@lru_cache(maxsize=256)
+def _is_helper_script_name(name: str) -> bool:
     return (
-        name in helper_exact
-        or name.startswith(helper_prefixes)
+        name in _HELPER_SCRIPT_NAMES
+        or name.startswith(_HELPER_SCRIPT_PREFIXES)
         or "helpers" in name
         or "utils" in name
     )
@@ -147,12 +165,34 @@ def _fallback_script_description(script_rel_path: str) -> str:
     return "Run repo script entrypoint."
 
 
+def _read_script_header_description(repo_root: Path, script: str) -> str | None:
+    """Return the first safe description comment in a script's header, if any."""
+    try:
+        # Iterate the buffered file rather than read_text(): the scan stops at the first
+        # code line, so a large script is never decoded in full. The line cap bounds
+        # scripts that are one long comment block.
+        with open(repo_root / script, encoding="utf-8", errors="ignore") as f:
+            for line in itertools.islice(f, _SCRIPT_HEADER_MAX_LINES):
+                line = line.strip()
+
+                if not line.startswith("#") and line:
+                    break
+
+                if line.startswith("#") and not line.startswith("#!"):
+                    candidate = line.lstrip("#").strip()
+                    if _is_safe_description(candidate):
+                        return candidate
+    except OSError as e:
+        logger.debug(f"Could not read script {script}: {e}")
+    return None
+
+
 def extract_shell_scripts(all_files: list[str], repo_root: Path) -> dict[str, list[CommandInfo]]:
     """
     Find and analyze shell scripts in the scripts/ directory.
 
     Args:
-        all_files: List of all file paths in the repo.
+        all_files: List of all repo-relative file paths ("/"-separated, as produced by scanning).
         repo_root: Path to the repository root.
 
     Returns:
@@ -160,38 +200,22 @@ def extract_shell_scripts(all_files: list[str], repo_root: Path) -> dict[str, li
     """
     commands: dict[str, list[CommandInfo]] = {"dev": [], "test": []}
 
-    script_files = [
-        f for f in all_files if f.replace("\\", "/").startswith("scripts/") and f.endswith(".sh")
-    ]
+    script_files = [f for f in all_files if f.startswith("scripts/") and f.endswith(".sh")]
 
     for script in script_files:
-        name = Path(script).name
+        name = script.rpartition("/")[2]
         command_str = f"bash {script}"
-
-        description = None
-        try:
-            with open(repo_root / script, encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    line = line.strip()
-
-                    if not line.startswith("#") and line:
-                        break
-
-                    if line.startswith("#") and not line.startswith("#!"):
-                        candidate = line.lstrip("#").strip()
-                        if _is_safe_description(candidate):
-                            description = candidate
-                            break
-        except OSError as e:
-            logger.debug(f"Could not read script {script}: {e}")
-            pass
+        is_helper = _is_helper_script(script)
 
         # Helper scripts should always be described neutrally as helpers,
         # even if they contain "safe" header comments. They are typically not
-        # direct user entrypoints.
-        if _is_helper_script(script):
+        # direct user entrypoints, and since the header cannot change that, it is not read.
+        description: str | None
+        if is_helper:
             description = _HELPER_SCRIPT_DESC
         else:
+            description = _read_script_header_description(repo_root, script)
+
             # Normalize empty to None
             if description is not None and not description.strip():
                 description = None
@@ -269,27 +293,58 @@ def detect_workflow_python_version(repo_root: Path) -> list[str]:
         List of detected Python versions (e.g., "3.11").
     """
     versions = set()
-    workflows_dir = repo_root / ".github" / "workflows"
-    if not workflows_dir.is_dir():
+    # One scandir instead of is_dir() + glob: entries carry their type, no Path is built per
+    # entry, and a missing directory is simply the OSError.
+    try:
+        with os.scandir(repo_root / WORKFLOWS_PREFIX) as it:
+            # Same predicate as the scans, so every listed workflow is also searched.
+            workflow_files = [
+                e.path for e in it if is_workflow_file(WORKFLOWS_PREFIX + e.name) and e.is_file()
+            ]
+    except OSError:
         return []
 
-    for wf in workflows_dir.glob("*.yml"):
-        try:
-            content = wf.read_text(encoding="utf-8", errors="ignore")
-            env_matches = re.findall(r'PYTHON_VERSION:\s*["\\]?([\d\.]+)["\\]?', content)
-            versions.update(env_matches)
-
-            step_matches = re.findall(r'python-version:\s*["\\]?([\d\.]+)["\\]?', content)
-            for v in step_matches:
-                if not v.startswith("$"):
-                    versions.add(v)
-        except OSError as e:
-            logger.debug(f"Failed to read workflow {wf}: {e}")
+    for wf in workflow_files:
+        content = _read_workflow(wf)
+        # Both patterns are case-sensitive literals first: skip the regexes entirely for
+        # workflows that never mention a Python version.
+        if content is None or ("PYTHON_VERSION" not in content and "python-version" not in content):
             continue
+        # The capture is digits and dots only, so expressions like ${{ matrix.python }}
+        # never match.
+        versions.update(_WORKFLOW_PY_VERSION_RE.findall(content))
 
     return sorted(versions)
 
 
+def _read_workflow(wf: str) -> str | None:
+    try:
+        with open(wf, encoding="utf-8", errors="ignore") as f:
+            return f.read()
+    except OSError as e:
+        logger.debug(f"Failed to read workflow {wf}: {e}")
+        return None
+
+
+# Parsed TOML documents kept across calls (caching policy: see file_cache). Framework
+# detection and metadata extraction both read the root pyproject.toml.
+_TOML_CACHE_SIZE = 32
+
+
+@memoize_file_load(maxsize=_TOML_CACHE_SIZE)
+def load_toml(path: Path) -> dict[str, Any]:
+    """
+    Parse a TOML file, memoized on its stat identity (see file_cache).
+
+    The returned dict is shared between callers and must be treated as read-only.
+
+    Raises:
+        OSError: If the file cannot be read.
+        tomllib.TOMLDecodeError: If the file is not valid TOML.
+    """
+    return tomllib.loads(path.read_text(encoding="utf-8", errors="ignore"))
+
+
 def extract_pyproject_metadata(repo_root: Path, pyproject_path: str) -> dict[str, Any]:
     """
     Extract metadata from pyproject.toml using tomllib.
@@ -308,8 +363,7 @@ def extract_pyproject_metadata(repo_root: Path, pyproject_path: str) -> dict[str
     }
 
     try:
-        content = (repo_root / pyproject_path).read_text(encoding="utf-8", errors="ignore")
-        data = tomllib.loads(content)
+        data = load_toml(repo_root / pyproject_path)
 
         # 1. Python Version Hints
         project = data.get("project", {})
@@ -321,19 +375,14 @@ def extract_pyproject_metadata(repo_root: Path, pyproject_path: str) -> dict[str
 
         # 3. Package Manager Detection
         tools = data.get("tool", {})
-        backend = str(metadata["build_backend"] or "")
+        # Lowercased once, not once per known manager.
+        backend = str(metadata["build_backend"] or "").lower()
         pm_list: list[str] = metadata["package_managers"]
 
         for key, manager in KNOWN_PACKAGE_MANAGERS.items():
-            # Check if manager is explicitly in [tool.X]
-            if key in tools:
-                if manager not in pm_list:
-                    pm_list.append(manager)
-
-            # Check if manager is mentioned in build-backend
-            if key in backend.lower():
-                if manager not in pm_list:
-                    pm_list.append(manager)
+            # Explicitly in [tool.X], or mentioned in build-backend
+            if (key in tools or key in backend) and manager not in pm_list:
+                pm_list.append(manager)
 
     except Exception as e:
         logger.warning(f"Failed to parse pyproject.toml at {pyproject_path}: {e}")
@@ -363,7 +412,7 @@ def _read_text_capped(path: Path, max_bytes: int) -> str | None:
 class PMContext:
     """Context for package manager detection."""
 
-    all_files: list[str]
+    file_set: set[str]  # normalized repo-relative path lookup
     file_names: set[str]  # basename lookup
     pkg_dir: str  # directory of the active package.json
     package_json_data: dict[str, Any]
@@ -406,10 +455,8 @@ class NpmStrategy(PackageManagerStrategy):
     def _has_lockfile(self, ctx: PMContext, filenames: tuple[str, ...]) -> bool:
         # 1. Local dir match
         prefix = ctx.pkg_dir.rstrip("/") + "/" if ctx.pkg_dir else ""
-        for name in filenames:
-            expected = f"{prefix}{name}"
-            if any(_norm_rel(f) == expected for f in ctx.all_files):
-                return True
+        if any(f"{prefix}{name}" in ctx.file_set for name in filenames):
+            return True
         # 2. Global fallback
         return any(name in ctx.file_names for name in filenames)
 
@@ -429,8 +476,7 @@ class LockfileBasedStrategy(PackageManagerStrategy):
     def detect(self, ctx: PMContext) -> bool:
         # 1. Local dir
         prefix = ctx.pkg_dir.rstrip("/") + "/" if ctx.pkg_dir else ""
-        expected = f"{prefix}{self._lockfile}"
-        if any(_norm_rel(f) == expected for f in ctx.all_files):
+        if f"{prefix}{self._lockfile}" in ctx.file_set:
             return True
         # 2. Global fallback
         return self._lockfile in ctx.file_names
@@ -480,17 +526,21 @@ def extract_node_package_json_commands(
     """
     root = repo_root.resolve()
     norm = [_norm_rel(p) for p in all_files if isinstance(p, str)]
-    names = {Path(p).name for p in norm}
 
-    pkg_candidates = [p for p in norm if Path(p).name == "package.json"]
+    # One basename pass (string split, no Path per file) feeds both lookups.
+    names: set[str] = set()
+    pkg_candidates = []
+    for p in norm:
+        base = p.rpartition("/")[2]
+        names.add(base)
+        if base == "package.json":
+            pkg_candidates.append(p)
     if not pkg_candidates:
         return {}
 
     # Deterministic selection: root preferred, else alphabetical
-    pkg_rel = "package.json" if "package.json" in pkg_candidates else sorted(pkg_candidates)[0]
-    pkg_dir = str(Path(pkg_rel).parent).replace("\\", "/")
-    if pkg_dir == ".":
-        pkg_dir = ""
+    pkg_rel = "package.json" if "package.json" in pkg_candidates else min(pkg_candidates)
+    pkg_dir = pkg_rel.rpartition("/")[0]  # "" for the root package.json
 
     pkg_abs = (root / pkg_rel).resolve()
     raw = _read_text_capped(pkg_abs, _NODE_PKG_JSON_MAX_BYTES)
@@ -506,7 +556,14 @@ def extract_node_package_json_commands(
         return {}
 
     # Build Context
-    ctx = PMContext(all_files=norm, file_names=names, pkg_dir=pkg_dir, package_json_data=data)
+    # all_files is normalized once here, so strategies probe file_set instead of
+    # re-normalizing and scanning every path per lockfile.
+    ctx = PMContext(
+        file_set=set(norm),
+        file_names=names,
+        pkg_dir=pkg_dir,
+        package_json_data=data,
+    )
 
     # Select Strategy
     strategy, has_lockfile = _select_node_package_manager(ctx)
@@ -0,0 +1,73 @@
+"""
+Memoized reads of small repository files (ignore files, pyproject.toml).
+
+This is the analyzer's caching policy. The MCP server is long-running and re-analyzes the
+same repositories, so work derived only from a small repository file is kept across
+analyze_repo calls:
+- file-backed results go through memoize_file_load, keyed on the file's stat identity;
+- results computed from already-read content (e.g. compiled gitignore specs) are keyed on
+  that content.
+Cached values are shared between callers and must be treated as read-only. Per-path
+computations (e.g. priority scoring) are not cached: each runs once per call, and the
+saving across calls is negligible next to the scan itself.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Git's "racily clean" rule: a file modified this recently may be rewritten again within
+# the filesystem's timestamp granularity, at the same size, without its mtime changing.
+# Such files are read fresh instead of being cached.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_FileKey = tuple[str, int, int, int, int]
+
+
+def file_cache_key(path: Path) -> _FileKey | None:
+    """
+    Return a key identifying the current contents of `path`, or None if it is too fresh.
+
+    The key carries mtime, ctime, inode and size. A file replaced by rename (how editors
+    and atomic writers save) always gets a new key through its inode, and an in-place
+    write moves mtime into the racy window. ctime only adds a guard against in-place
+    rewrites that restore the old mtime, at the filesystem's timestamp granularity.
+
+    Raises:
+        OSError: If the file cannot be stat-ed (e.g. FileNotFoundError).
+    """
+    st = path.stat()
+    if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size)
+
+
+def memoize_file_load(maxsize: int) -> Callable[[Callable[[Path], T]], Callable[[Path], T]]:
+    """
+    Decorate a `load(path)` function so its result is cached per file_cache_key.
+
+    Racily fresh files bypass the cache. Results are shared between callers and must be
+    treated as read-only. Exceptions from stat() or `load` propagate and are not cached.
+    """
+
+    def decorate(load: Callable[[Path], T]) -> Callable[[Path], T]:
+        @lru_cache(maxsize=maxsize)
+        def cached(key: _FileKey) -> T:
+            return load(Path(key[0]))
+
+        @wraps(load)
+        def wrapper(path: Path) -> T:
+            key = file_cache_key(path)
+            if key is None:
+                return load(path)
+            return cached(key)
+
+        return wrapper
+
+    return decorate
@@ -12,7 +12,6 @@ Deterministic and static-only (no subprocess, no commands).
 from __future__ import annotations
 
 import re
-import tomllib
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -20,6 +19,7 @@ from pathlib import Path
 from typing import Any
 
 from ..schema import FrameworkInfo, PythonEnvFile
+from .extractors import load_toml
 
 _MAX_BYTES = 256_000
 
@@ -370,7 +370,8 @@ def detect_frameworks(
     try:
         p.relative_to(repo_root)
         if p.is_file() and p.stat().st_size <= _MAX_BYTES:
-            pyproject_data = tomllib.loads(p.read_text(encoding="utf-8", errors="ignore"))
+            # Shared parse: extract_pyproject_metadata reads the same file.
+            pyproject_data = load_toml(p)
     except Exception:
         pass
 
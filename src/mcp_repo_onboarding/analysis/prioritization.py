@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from pathlib import PurePosixPath
-
 __all__ = ["get_config_priority", "get_doc_priority", "get_dep_priority"]
 
 # NOTE: Inputs are expected to be normalized repo-relative POSIX paths (contract rule).
+# Scoring therefore works on plain strings; no PurePosixPath is built per call.
+
+
+def _basename_lower(path: str) -> str:
+    return path.rpartition("/")[2].lower()
+
 
 # ----------------------------
 # Config prioritization
@@ -36,18 +40,17 @@ def get_config_priority(path: str) -> int:
     - workflows prefix applies only when no exact-name match
     - root bonus +100 if path has no '/'
     """
-    p = str(PurePosixPath(path))
-    name = PurePosixPath(p).name.lower()
+    name = _basename_lower(path)
 
     score = _CONFIG_BASE_SCORE
 
     exact = _CONFIG_EXACT_SCORES.get(name)
     if exact is not None:
         score = exact
-    elif p.startswith(_CONFIG_WORKFLOWS_PREFIX):
+    elif path.startswith(_CONFIG_WORKFLOWS_PREFIX):
         score = 150
 
-    if "/" not in p:
+    if "/" not in path:
         score += _CONFIG_ROOT_BONUS
 
     return score
@@ -78,23 +81,22 @@ def get_doc_priority(path: str) -> int:
       - contains 'admin' -> -20
       - if under tests/test/examples/scripts/src -> -200
     """
-    p = str(PurePosixPath(path))
-    p_lower = p.lower()
-    name = PurePosixPath(p).name.lower()
+    p_lower = path.lower()
+    name = _basename_lower(path)
 
     score = _DOC_BASE_SCORE
 
     # Root standards
-    if "/" not in p and name.startswith(_DOC_ROOT_PREFIXES):
+    if "/" not in path and name.startswith(_DOC_ROOT_PREFIXES):
         score = 300
 
     # Other buckets (only if not root-standard)
     if score < 300:
-        if p.startswith("docs/") and "/" not in p[5:]:
+        if path.startswith("docs/") and "/" not in path[5:]:
             score = 250
         elif any(kw in p_lower for kw in _DOC_KEYWORDS):
             score = 200
-        elif p.startswith("docs/"):
+        elif path.startswith("docs/"):
             score = 150
 
     # Penalties
@@ -126,14 +128,13 @@ def get_dep_priority(path: str) -> int:
     - if manifest and nested -> 150
     - penalties: under tests/test/examples/scripts -> -200
     """
-    p = str(PurePosixPath(path))
-    p_lower = p.lower()
-    name = PurePosixPath(p).name.lower()
+    p_lower = path.lower()
+    name = _basename_lower(path)
 
     score = _DEP_BASE_SCORE
 
     is_manifest = name == "pyproject.toml" or name.startswith("requirements")
-    is_root = "/" not in p
+    is_root = "/" not in path
 
     if is_manifest:
         score = 300 if is_root else 150
@@ -1,16 +1,73 @@
 import logging
+import operator
 import os
+from collections import deque
 from pathlib import Path
 
 from .structs import IgnoreMatcher
 
 logger = logging.getLogger(__name__)
 
+# Paths are emitted with "/" separators; only Windows needs a rewrite of the sliced path.
+_NEEDS_SEP_NORMALIZATION = os.sep != "/"
+
+
+def _entry_kind(entry: os.DirEntry[str]) -> tuple[bool, bool]:
+    """
+    Return (is_dir, is_file) for a scandir entry.
+
+    os.scandir already knows each entry's type from the directory listing (d_type), so
+    regular entries are classified with follow_symlinks=False and cost no syscall.
+    Only symlinks are followed (one stat of the target): in-repo links are scanned like
+    what they point to, and IgnoreMatcher rejects links that resolve outside the repo.
+
+    Contract: traversal code must get type/size information from the DirEntry
+    (entry.is_dir/is_file, entry.stat(follow_symlinks=False)) rather than re-stat-ing
+    the path through pathlib.
+    """
+    if entry.is_symlink():
+        return entry.is_dir(), entry.is_file()
+    return entry.is_dir(follow_symlinks=False), entry.is_file(follow_symlinks=False)
+
+
+# C-level key for the per-directory sort (no Python frame per entry).
+_entry_name = operator.attrgetter("name")
+
+
+def list_dir_sorted(path: str | Path) -> list[os.DirEntry[str]]:
+    """
+    List a directory with os.scandir, sorted by name (the scan's deterministic order).
+
+    The sort is what makes max_files truncation reproducible: os.scandir order depends on
+    the filesystem, so without it the files kept under the cap could vary between machines.
+
+    Raises:
+        OSError: If the directory cannot be listed.
+    """
+    with os.scandir(path) as entries:
+        return sorted(entries, key=_entry_name)
+
+
+def _is_ignored(
+    ignore: IgnoreMatcher, entry: os.DirEntry[str], rel_path: str, is_dir: bool
+) -> bool:
+    """
+    Apply the ignore rules to a scanned entry.
+
+    Regular entries are matched on the repo-relative path we already have, with no
+    resolve() syscall. Symlinks go through the full should_ignore, which resolves the
+    target and rejects anything that escapes the repository root.
+    """
+    if entry.is_symlink():
+        return ignore.should_ignore(Path(entry.path), is_dir=is_dir)
+    return ignore.should_ignore_relative(rel_path, is_dir=is_dir)
+
 
 def scan_repo_files(
     root: Path,
     ignore: IgnoreMatcher,
     max_files: int = 5000,
+    root_entries: list[os.DirEntry[str]] | None = None,
 ) -> tuple[list[str], list[str]]:
     """
     Scan the repository for files, respecting ignore rules.
@@ -19,62 +76,67 @@ def scan_repo_files(
         root: The root directory to scan.
         ignore: The IgnoreMatcher instance.
         max_files: Maximum number of files to return.
+        root_entries: Optional name-sorted listing of root (see list_dir_sorted), for
+            callers that already listed it; avoids scanning the root directory twice.
 
     Returns:
         A tuple containing a list of all file paths and a list of Python file paths.
+        Paths are repo-relative, unique, and always use "/" separators.
     """
     all_files: list[str] = []
     py_files: list[str] = []
 
+    # entry.path is always os.path.join(<dir under root>, name), so the repo-relative
+    # path is a plain slice of it; no need to build and re-split a Path per entry.
+    root_prefix_len = len(os.path.join(str(root), ""))
+
     try:
-        with os.scandir(root) as entries:
-            sorted_entries = sorted(entries, key=lambda e: e.name)
-            dirs_to_visit = []
-            for entry in sorted_entries:
-                entry_path = Path(entry.path)
-                is_dir = entry.is_dir()
-
-                if ignore.should_ignore(entry_path, is_dir=is_dir):
-                    continue
+        if root_entries is None:
+            root_entries = list_dir_sorted(root)
+        dirs_to_visit = []
+        for entry in root_entries:
+            if len(all_files) >= max_files:
+                break
 
-                if is_dir:
-                    dirs_to_visit.append(entry.path)
-                elif entry.is_file():
-                    rel_path = entry.name
-                    all_files.append(rel_path)
-                    if rel_path.endswith(".py"):
-                        py_files.append(rel_path)
+            is_dir, is_file = _entry_kind(entry)
+            rel_path = entry.name
+
+            if _is_ignored(ignore, entry, rel_path, is_dir):
+                continue
+
+            if is_dir:
+                dirs_to_visit.append(entry.path)
+            elif is_file:
+                all_files.append(rel_path)
+                if entry.name.endswith(".py"):
+                    py_files.append(rel_path)
     except OSError as e:
         logger.warning(f"Error scanning directory {root}: {e}")
         return [], []
 
-    queue = dirs_to_visit
+    queue = deque(dirs_to_visit)
     while queue and len(all_files) < max_files:
-        current_dir = queue.pop(0)
+        current_dir = queue.popleft()
         try:
-            with os.scandir(current_dir) as entries:
-                sorted_entries = sorted(entries, key=lambda e: e.name)
-                for entry in sorted_entries:
-                    if len(all_files) >= max_files:
-                        break
-
-                    entry_path = Path(entry.path)
-                    is_dir = entry.is_dir()
-
-                    if ignore.should_ignore(entry_path, is_dir=is_dir):
-                        continue
-
-                    if is_dir:
-                        queue.append(entry.path)
-                    elif entry.is_file():
-                        try:
-                            rel_path = str(entry_path.relative_to(root))
-                            all_files.append(rel_path)
-                            if rel_path.endswith(".py"):
-                                py_files.append(rel_path)
-                        except ValueError as e:
-                            logger.debug(f"Skipping invalid path {entry_path}: {e}")
-                            continue
+            for entry in list_dir_sorted(current_dir):
+                if len(all_files) >= max_files:
+                    break
+
+                is_dir, is_file = _entry_kind(entry)
+                rel_path = entry.path[root_prefix_len:]
+                if _NEEDS_SEP_NORMALIZATION:
+                    rel_path = rel_path.replace(os.sep, "/")
+
+                if _is_ignored(ignore, entry, rel_path, is_dir):
+                    continue
+
+                if is_dir:
+                    queue.append(entry.path)
+                elif is_file:
+                    all_files.append(rel_path)
+                    # Classify on the basename scandir already handed us.
+                    if entry.name.endswith(".py"):
+                        py_files.append(rel_path)
         except OSError as e:
             logger.warning(f"Error scanning subdirectory {current_dir}: {e}")
             continue
@@ -1,7 +1,70 @@
+import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import pathspec
 
+# pathspec (0.12) names each GitWildMatchPattern's directory separator group "ps_d". The name
+# is private to pathspec; tests pin it so an upgrade that renames it fails loudly.
+_PATHSPEC_DIR_GROUP = "(?P<ps_d>/)"
+
+
+def _combine_gitignore_patterns(spec: pathspec.PathSpec) -> re.Pattern[str] | None:
+    """
+    Fold a PathSpec's patterns into one alternation regex, when that is equivalent.
+
+    PathSpec.match_file tries every pattern's regex in turn, because a later negation
+    ("!pattern") can re-include a path. Without negations the verdict is simply "any
+    pattern matches", which a single compiled alternation answers in one call.
+
+    Returns:
+        The combined regex, or None if the spec has negations or the patterns cannot be
+        folded, in which case pathspec must evaluate them itself.
+    """
+    sources: list[str] = []
+    for pattern in spec.patterns:
+        if pattern.include is None:  # blank line or comment
+            continue
+        if not pattern.include:
+            return None
+        regex = getattr(pattern, "regex", None)
+        if regex is None or not isinstance(regex.pattern, str):
+            return None
+        # Group names must be unique within one regex and this group is never read, so drop it.
+        sources.append(regex.pattern.replace(_PATHSPEC_DIR_GROUP, "/"))
+    if not sources:
+        return re.compile(r"(?!)")  # matches nothing
+    try:
+        return re.compile("|".join(f"(?:{src})" for src in sources))
+    except re.error:
+        # e.g. pathspec renamed its group and the names now collide; fall back to match_file.
+        return None
+
+
+# Compiled gitignore specs, keyed on the .gitignore lines and shared across IgnoreMatcher
+# instances (caching policy: see file_cache).
+_GITIGNORE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_GITIGNORE_CACHE_SIZE)
+def _compile_gitignore(
+    patterns: tuple[str, ...],
+) -> tuple[pathspec.PathSpec, Callable[[str], object]]:
+    """
+    Build the PathSpec for gitignore lines and pick the cheapest matcher for it.
+
+    Keyed on the lines themselves, so an edited .gitignore simply misses the cache.
+
+    Returns:
+        The PathSpec and either its combined regex's match or PathSpec.match_file.
+    """
+    spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, patterns)
+    combined = _combine_gitignore_patterns(spec)
+    if combined is not None:
+        return spec, combined.match
+    return spec, spec.match_file
+
 
 class IgnoreMatcher:
     """Matches paths against a set of ignore patterns."""
@@ -22,14 +85,26 @@ class IgnoreMatcher:
         """
         self.repo_root = repo_root.resolve()
         self.safety_ignores = list(safety_ignores)
-
-        self._pathspec: pathspec.PathSpec | None
+        # Every safety rule reduces to a substring test on "/<rel_path>/":
+        # - "name/" (directory anywhere in the path) -> "/name/"
+        # - "name" (exact path, basename, or "/name" substring) -> "/name"
+        # The needles are folded into one literal alternation, so the per-path check is a
+        # single regex search rather than one substring test per rule.
+        needles = [
+            f"/{si.strip('/')}/" if si.endswith("/") else f"/{si.strip('/')}"
+            for si in self.safety_ignores
+        ]
+        self._safety_re: re.Pattern[str] | None = (
+            re.compile("|".join(map(re.escape, needles))) if needles else None
+        )
+
+        # Gitignore matching is bound once to the cheapest applicable matcher; None means
+        # there are no gitignore rules (e.g. the safety-only targeted scan), so the per-path
+        # check is a single `is None` test.
+        self._pathspec: pathspec.PathSpec | None = None
+        self._gitignore_match: Callable[[str], object] | None = None
         if gitignore_patterns:
-            self._pathspec = pathspec.PathSpec.from_lines(
-                pathspec.patterns.GitWildMatchPattern, gitignore_patterns
-            )
-        else:
-            self._pathspec = None
+            self._pathspec, self._gitignore_match = _compile_gitignore(tuple(gitignore_patterns))
 
     def is_safety_ignored(self, rel_path: str) -> bool:
         """
@@ -38,25 +113,10 @@ class IgnoreMatcher:
         """
         # Normalize separators and strip leading/trailing slashes for comparison
         clean_rel_path = rel_path.replace("\\", "/").strip("/")
-
-        for si in self.safety_ignores:
-            si_clean = si.strip("/")
-
-            if si.endswith("/"):
-                # Directory match anywhere in the path (e.g. site-packages/ or tests/fixtures/)
-                if f"/{si_clean}/" in f"/{clean_rel_path}/":
-                    return True
-            else:
-                # File-like match (e.g. .coverage)
-                # Matches exact name, matching as a filename at any level, or as a substring with /
-                if (
-                    clean_rel_path == si_clean
-                    or Path(clean_rel_path).name == si_clean
-                    or f"/{si_clean}" in f"/{clean_rel_path}"
-                ):
-                    return True
-
-        return False
+        padded = f"/{clean_rel_path}/"
+        # A file-like needle never ends in "/", so testing it against the padded form is
+        # the same as testing it against "/<rel_path>".
+        return self._safety_re is not None and self._safety_re.search(padded) is not None
 
     def should_ignore(self, path: Path, is_dir: bool = False) -> bool:
         """
@@ -72,22 +132,37 @@ class IgnoreMatcher:
         try:
             resolved_path = path.resolve()
             rel_path = resolved_path.relative_to(self.repo_root)
-            rel_path_str = str(rel_path.as_posix())
+        except (ValueError, OSError):
+            # If path resolution fails or is outside the repository root, ignore it for safety.
+            return True
 
-            if is_dir and not rel_path_str.endswith("/"):
-                rel_path_str += "/"
+        return self.should_ignore_relative(rel_path.as_posix(), is_dir=is_dir)
 
-            if self.is_safety_ignored(rel_path_str):
-                return True
+    def should_ignore_relative(self, rel_path_str: str, is_dir: bool = False) -> bool:
+        """
+        Check if an already repo-relative POSIX path should be ignored.
 
-            if self._pathspec:
-                return self._pathspec.match_file(rel_path_str)
+        Unlike should_ignore, this performs no filesystem access: the caller vouches that
+        the path is inside the repository (e.g. a non-symlink entry reached by scanning
+        down from the root), so no resolve()/containment check is needed.
 
-            return False
-        except (ValueError, OSError):
-            # If path resolution fails or is outside the repository root, ignore it for safety.
+        Args:
+            rel_path_str: Repo-relative path with "/" separators.
+            is_dir: Whether the path matches a directory.
+
+        Returns:
+            True if the path should be ignored, False otherwise.
+        """
+        if is_dir and not rel_path_str.endswith("/"):
+            rel_path_str += "/"
+
+        if self.is_safety_ignored(rel_path_str):
             return True
 
+        if self._gitignore_match is None:
+            return False
+        return bool(self._gitignore_match(rel_path_str))
+
     def should_descend(self, dir_path: Path) -> bool:
         """
         Check if the scanner should descend into a directory.
@@ -9,7 +9,6 @@ Phase 8 scaffolding for future polyglot support (#81).
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any
 
 # Evidence file patterns for each tooling ecosystem
@@ -81,7 +80,29 @@ class ToolingDetection:
     note: str | None = None
 
 
-def detect_other_tooling(all_files: list[str]) -> list[ToolingDetection]:
+def index_basenames(all_files: list[str], basenames: list[str] | None = None) -> dict[str, str]:
+    """Map each lowercase basename to the first repo-relative path that has it.
+
+    Args:
+        all_files: List of repo-relative file paths ("/"-separated).
+        basenames: Optional lowercase basenames aligned with all_files, when the caller
+            already computed them.
+
+    Returns:
+        Dict of basename (lowercase) -> first path in all_files order.
+    """
+    if basenames is None:
+        basenames = [f.rpartition("/")[2].lower() for f in all_files]
+    file_names_lower: dict[str, str] = {}
+    for name, f in zip(basenames, all_files, strict=True):
+        # setdefault keeps the first occurrence
+        file_names_lower.setdefault(name, f)
+    return file_names_lower
+
+
+def detect_other_tooling(
+    all_files: list[str], basename_index: dict[str, str] | None = None
+) -> list[ToolingDetection]:
     """Detect non-Python tooling from file list.
 
     Static-only. No subprocess, no file content reads.
@@ -89,16 +110,14 @@ def detect_other_tooling(all_files: list[str]) -> list[ToolingDetection]:
 
     Args:
         all_files: List of repo-relative file paths.
+        basename_index: Optional index_basenames(all_files), when the caller already
+            built it; saves another pass over all_files.
 
     Returns:
         List of ToolingDetection results, sorted by name.
     """
-    # Build lookup set of lowercase filenames for matching
-    file_names_lower: dict[str, str] = {}
-    for f in all_files:
-        name_lower = Path(f).name.lower()
-        if name_lower not in file_names_lower:
-            file_names_lower[name_lower] = f  # Keep first occurrence
+    # Lookup of lowercase filenames for matching
+    file_names_lower = basename_index if basename_index is not None else index_basenames(all_files)
 
     detections: list[ToolingDetection] = []
 
@@ -95,7 +95,7 @@ _overlap = CONFIG_FILE_TYPES & DEPENDENCY_FILE_TYPES
 if _overlap:
     raise RuntimeError(f"config.py invariant violated: overlapping file types: {_overlap}")
 
-# Prefix-based dependency detection (preserve existing behavior in catalog.py):
+# Prefix-based dependency detection:
 # - requirements*.txt / requirements*.in
 DEPENDENCY_PREFIXES: Final[tuple[str, ...]] = ("requirements",)
 DEPENDENCY_SUFFIXES: Final[tuple[str, ...]] = (".txt", ".in")
@@ -118,47 +118,66 @@ def classify_filename(name: str) -> FileCategory | None:
     if kind is not None:
         return kind.category
 
-    if any(n.startswith(pfx) for pfx in DEPENDENCY_PREFIXES) and any(
-        n.endswith(sfx) for sfx in DEPENDENCY_SUFFIXES
-    ):
+    # Tuples go straight to startswith/endswith: one C-level call each, no generator.
+    if n.startswith(DEPENDENCY_PREFIXES) and n.endswith(DEPENDENCY_SUFFIXES):
         return "dependency"
 
     return None
 
 
+# GitHub Actions workflows: *.yml / *.yaml files under .github/workflows/.
+WORKFLOWS_PREFIX: Final[str] = ".github/workflows/"
+WORKFLOW_SUFFIXES: Final[tuple[str, ...]] = (".yml", ".yaml")
+
+
+def is_workflow_file(rel_path: str) -> bool:
+    """
+    GitHub Actions workflow file detection (repo-relative POSIX path).
+
+    Paths are "/"-separated by contract (scan_repo_files and the targeted scan normalize
+    them), so a single startswith on the prefix is enough. The suffix test is
+    case-insensitive.
+    """
+    return rel_path.startswith(WORKFLOWS_PREFIX) and rel_path.lower().endswith(WORKFLOW_SUFFIXES)
+
+
 # Extensions to exclude from documentation entirely
-DOC_EXCLUDED_EXTENSIONS: Final[set[str]] = {
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".webp",
-    ".svg",
-    ".ico",
-    ".pdf",
-    ".zip",
-    ".tar",
-    ".gz",
-    ".7z",
-    ".woff",
-    ".woff2",
-    ".ttf",
-    ".otf",
-    ".mp4",
-    ".mov",
-    ".mp3",
-    ".css",
-    ".js",
-    ".map",
-}
+DOC_EXCLUDED_EXTENSIONS: Final[frozenset[str]] = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".svg",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".7z",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".mp4",
+        ".mov",
+        ".mp3",
+        ".css",
+        ".js",
+        ".map",
+    }
+)
 
 # Extensions considered "human documentation" under docs/ directory
-DOC_HUMAN_EXTENSIONS: Final[set[str]] = {
-    ".md",
-    ".rst",
-    ".txt",
-    ".adoc",
-}
+DOC_HUMAN_EXTENSIONS: Final[frozenset[str]] = frozenset(
+    {
+        ".md",
+        ".rst",
+        ".txt",
+        ".adoc",
+    }
+)
 
 # Maximum number of evidence files to display for other tooling detections
 MAX_EVIDENCE_FILES_DISPLAYED: Final[int] = 3
@@ -73,3 +73,26 @@ def test_doc_truncation_excludes_binaries_from_total(temp_repo: Callable[[str],
     assert truncation_note is not None
     assert f"total={expected_total}" in truncation_note
     assert len(analysis.docs) == 10
+
+
+def test_categorize_prefilter_keeps_every_rule_family() -> None:
+    """The first-character pre-filter must not drop any file a categorization rule accepts."""
+    from mcp_repo_onboarding.analysis.core import _categorize_files
+
+    files = [
+        "LICENSE",
+        "SECURITY.md",
+        "docs/zebra.md",
+        "environment.yml",
+        "Pipfile",
+        ".github/workflows/zz.yaml",
+        "Makefile",
+        "data_1.txt",
+        "src_1.py",
+    ]
+
+    docs, configs, deps, _ = _categorize_files(files)
+
+    assert {d.path for d in docs} == {"LICENSE", "SECURITY.md", "docs/zebra.md"}
+    assert {c.path for c in configs} == {".github/workflows/zz.yaml", "Makefile"}
+    assert {d.path for d in deps} == {"environment.yml", "Pipfile"}
@@ -18,6 +18,16 @@ def test_empty_repo(temp_repo: Callable[[str], Path]) -> None:
     assert analysis.python is None
 
 
+def test_missing_repo_path(tmp_path: Path) -> None:
+    """A missing repository path yields an empty report with an explanatory note."""
+    analysis = analyze_repo(str(tmp_path / "does-not-exist"))
+
+    assert analysis.primaryTooling == "Unknown"
+    assert len(analysis.docs) == 0
+    assert analysis.python is None
+    assert analysis.notes == ["Repository path not found or not a directory."]
+
+
 def test_repo_only_binary_files(temp_repo: Callable[[str], Path]) -> None:
     """Test analysis on a repository containing only binary files (images)."""
     repo_path = temp_repo("edge-cases")
@@ -24,3 +24,23 @@ install:
     a = analyze_repo(repo_path=str(repo))
     assert a.scripts.install[0].description is not None
     assert len(a.scripts.install[0].description) > 0
+
+
+def test_make_targets_parsed_from_raw_bytes(tmp_path: Path) -> None:
+    from mcp_repo_onboarding.analysis import extract_makefile_commands
+
+    (tmp_path / "Makefile").write_bytes(
+        b"# build helpers \xff\r\n"
+        b"lint format:\r\n"
+        b"\tpython -m tool --opt=a:b\r\n"
+        b"clean\n"
+        b"test: deps\n"
+        b"\t@echo test: done\n"
+    )
+
+    cmds = extract_makefile_commands(tmp_path, "Makefile")
+
+    assert [c.command for c in cmds["lint"]] == ["make lint"]
+    assert [c.command for c in cmds["format"]] == ["make format"]
+    assert [c.command for c in cmds["test"]] == ["make test"]
+    assert "clean" not in str(cmds)
@@ -1,3 +1,5 @@
+import os
+import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -29,3 +31,48 @@ def test_pyproject_malformed_toml(temp_repo: Callable[[str], Path]) -> None:
     assert analysis is not None
     # Should still find Python files if they exist (none in this fixture yet)
     # but packageManagers and version hints might be empty or partial
+
+
+def test_pyproject_parse_is_shared_until_the_file_changes(tmp_path: Path) -> None:
+    """One parse serves repeated reads; an edited pyproject.toml is parsed again."""
+    from mcp_repo_onboarding.analysis.extractors import load_toml
+
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.poetry]\nname = 'demo'\n")
+    # Files modified within the racy window are always re-read; age this one past it.
+    old_ns = time.time_ns() - 60_000_000_000
+    os.utime(pyproject, ns=(old_ns, old_ns))
+
+    first = load_toml(pyproject)
+    assert load_toml(pyproject) is first
+
+    pyproject.write_text("[tool.hatch]\nversion = '1'\nextra = 'key'\n")
+    assert "hatch" in load_toml(pyproject)["tool"]
+
+    analysis = analyze_repo(str(tmp_path))
+    assert analysis.python is not None
+    assert "poetry" not in analysis.python.packageManagers
+    assert "hatch" in analysis.python.packageManagers
+
+
+def test_same_size_pyproject_rewrite_is_reparsed(tmp_path: Path) -> None:
+    """A same-size replacement that keeps the mtime must not serve the stale parse."""
+    from mcp_repo_onboarding.analysis.extractors import load_toml
+
+    pyproject = tmp_path / "pyproject.toml"
+    old_ns = time.time_ns() - 60_000_000_000
+    pyproject.write_text("[tool.aaaa]\n")
+    os.utime(pyproject, ns=(old_ns, old_ns))
+    assert "aaaa" in load_toml(pyproject)["tool"]
+
+    # Renamed over the old file, as editors save: the inode changes deterministically,
+    # whereas ctime may not move between two writes on a coarse-timestamp filesystem.
+    replacement = tmp_path / "pyproject.toml.new"
+    replacement.write_text("[tool.bbbb]\n")
+    os.utime(replacement, ns=(old_ns, old_ns))
+    os.replace(replacement, pyproject)
+    assert "bbbb" in load_toml(pyproject)["tool"]
+
+    # Freshly written files bypass the cache even without the utime reset.
+    pyproject.write_text("[tool.cccc]\n")
+    assert "cccc" in load_toml(pyproject)["tool"]
@@ -3,6 +3,7 @@ from pathlib import Path
 import pytest
 
 from mcp_repo_onboarding.analysis.core import analyze_repo
+from mcp_repo_onboarding.analysis.extractors import detect_workflow_python_version
 
 
 def test_python_pin_range_rejection(fixtures_dir: Path) -> None:
@@ -23,6 +24,16 @@ def test_workflow_python_pin_env_success(fixtures_dir: Path) -> None:
     assert analysis.python.pythonVersionHints == ["3.14"]
 
 
+def test_yaml_workflow_versions_are_detected(tmp_path: Path) -> None:
+    """.yaml workflows are listed by the scans, so their Python versions must be read too."""
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yaml").write_text('env:\n  PYTHON_VERSION: "3.12"\n')
+    (workflows / "lint.yml").write_text('steps:\n  - with:\n      python-version: "3.11"\n')
+
+    assert detect_workflow_python_version(tmp_path) == ["3.11", "3.12"]
+
+
 @pytest.mark.parametrize(
     "version,expected",
     [
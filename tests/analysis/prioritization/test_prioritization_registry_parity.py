@@ -144,3 +144,22 @@ def test_manifest_distinction_preserved() -> None:
     manifest_nested = get_dep_priority("sub/requirements.txt")
     non_manifest_nested = get_dep_priority("sub/setup.py")
     assert manifest_nested > non_manifest_nested, "Manifest nested scoring not distinct"
+
+
+def test_capped_sort_matches_full_sort_prefix() -> None:
+    """Bounded selection must return exactly the head of the full score/path ordering."""
+    from mcp_repo_onboarding.analysis.core import sort_by_score_then_path
+    from mcp_repo_onboarding.schema import DocInfo
+
+    paths = [f"docs/guide_{i}.md" for i in range(30)] + [
+        "README.md",
+        "docs/nested/setup.md",
+        "tests/README.md",
+        "quickstart.md",
+    ]
+    docs = [DocInfo(path=p, type="doc") for p in reversed(paths)]
+
+    full = sort_by_score_then_path(docs, get_doc_priority)
+    capped = sort_by_score_then_path(docs, get_doc_priority, limit=10)
+
+    assert [d.path for d in capped] == [d.path for d in full[:10]]
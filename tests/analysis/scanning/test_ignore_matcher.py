@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from mcp_repo_onboarding.analysis import IgnoreMatcher
 
 # Pure Unit Tests - No Filesystem Access
@@ -68,3 +70,88 @@ def test_should_descend_optimization() -> None:
     assert not matcher.should_descend(repo_root / "node_modules")
     assert not matcher.should_descend(repo_root / "dist")
     assert matcher.should_descend(repo_root / "src")
+
+
+def test_should_ignore_relative_matches_should_ignore() -> None:
+    """The string-based fast path applies the same rules as the Path-based check."""
+    repo_root = Path("/tmp/repo")
+    matcher = IgnoreMatcher(
+        repo_root=repo_root,
+        safety_ignores=[".venv/"],
+        gitignore_patterns=["*.log", "temp/", "!temp/keep.txt"],
+    )
+
+    for rel, is_dir in [
+        (".venv", True),
+        (".venv/bin/python", False),
+        ("error.log", False),
+        ("temp", True),
+        ("temp/keep.txt", False),
+        ("src/app.py", False),
+    ]:
+        assert matcher.should_ignore_relative(rel, is_dir=is_dir) == matcher.should_ignore(
+            repo_root / rel, is_dir=is_dir
+        )
+
+
+def test_combined_gitignore_regex_matches_pathspec() -> None:
+    """Without negations the folded single regex must agree with pathspec on every path."""
+    import pathspec
+
+    patterns = ["*.log", "/dist", "build/", "a/**/b", "**/cache", "*.py[cod]", "# comment", ""]
+    matcher = IgnoreMatcher(
+        repo_root=Path("/tmp/repo"), safety_ignores=[], gitignore_patterns=patterns
+    )
+    spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, patterns)
+
+    for rel in [
+        "x.log",
+        "deep/x.log",
+        "dist",
+        "src/dist",
+        "build/",
+        "src/build/out.o",
+        "a/b",
+        "a/x/y/b",
+        "z/cache/",
+        "m.pyc",
+        "src/app.py",
+    ]:
+        assert matcher.should_ignore_relative(rel) == spec.match_file(rel), rel
+
+
+def test_gitignore_spec_is_shared_across_matchers() -> None:
+    """Identical gitignore lines reuse one compiled spec; different lines do not."""
+    repo_root = Path("/tmp/repo")
+    first = IgnoreMatcher(repo_root=repo_root, safety_ignores=[], gitignore_patterns=["*.tmp"])
+    second = IgnoreMatcher(repo_root=repo_root, safety_ignores=[], gitignore_patterns=["*.tmp"])
+    other = IgnoreMatcher(repo_root=repo_root, safety_ignores=[], gitignore_patterns=["*.bak"])
+
+    assert first._pathspec is second._pathspec
+    assert first._pathspec is not other._pathspec
+    assert second.should_ignore_relative("x.tmp")
+    assert not other.should_ignore_relative("x.tmp")
+
+
+def test_pathspec_dir_group_name_is_pinned() -> None:
+    """The combined regex relies on pathspec's private group name; a rename must fail here."""
+    import pathspec
+
+    from mcp_repo_onboarding.analysis.structs import _PATHSPEC_DIR_GROUP, _compile_gitignore
+
+    regex = pathspec.patterns.GitWildMatchPattern("build/").regex
+    assert _PATHSPEC_DIR_GROUP in regex.pattern
+
+    spec, match = _compile_gitignore(("*.log", "build/"))
+    assert match != spec.match_file
+
+
+def test_uncombinable_patterns_fall_back_to_pathspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    """If the group name no longer matches, duplicate groups must not break matching."""
+    import pathspec
+
+    from mcp_repo_onboarding.analysis import structs
+
+    monkeypatch.setattr(structs, "_PATHSPEC_DIR_GROUP", "(?P<renamed>/)")
+    spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, ["build/", "dist/"])
+    assert structs._combine_gitignore_patterns(spec) is None
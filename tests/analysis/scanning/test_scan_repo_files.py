@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from mcp_repo_onboarding.analysis import IgnoreMatcher, scan_repo_files
+from mcp_repo_onboarding.analysis.scanning import list_dir_sorted
+
+
+def test_prefetched_root_entries_match_fresh_scan(tmp_path: Path) -> None:
+    """Seeding the scan with an existing root listing must not change its output."""
+    (tmp_path / "b.py").write_text("x")
+    (tmp_path / "a.txt").write_text("x")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("x")
+
+    ignore = IgnoreMatcher(repo_root=tmp_path, safety_ignores=["build/"], gitignore_patterns=[])
+
+    fresh = scan_repo_files(tmp_path, ignore)
+    seeded = scan_repo_files(tmp_path, ignore, root_entries=list_dir_sorted(tmp_path))
+
+    assert seeded == fresh == (["a.txt", "b.py", "pkg/mod.py"], ["b.py", "pkg/mod.py"])
+
+
+def test_max_files_caps_flat_root_directory(tmp_path: Path) -> None:
+    """A flat repo with more root-level files than max_files must still be capped."""
+    for i in range(25):
+        (tmp_path / f"file_{i:02d}.py").write_text("x")
+
+    ignore = IgnoreMatcher(repo_root=tmp_path, safety_ignores=[], gitignore_patterns=[])
+    all_files, py_files = scan_repo_files(tmp_path, ignore, max_files=10)
+
+    assert all_files == [f"file_{i:02d}.py" for i in range(10)]
+    assert py_files == all_files
@@ -1,3 +1,5 @@
+import os
+import time
 from pathlib import Path
 
 from mcp_repo_onboarding.analysis import analyze_repo
@@ -55,3 +57,72 @@ def test_integration_targeted_signals_not_blocked() -> None:
     import shutil
 
     shutil.rmtree(repo_root)
+
+
+def test_git_info_exclude_is_respected(tmp_path: Path) -> None:
+    """Patterns in .git/info/exclude ignore files like .gitignore, which can re-include them."""
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("docs/local.md\nCONTRIBUTING.md\n")
+    (tmp_path / ".gitignore").write_text("!CONTRIBUTING.md\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "local.md").write_text("scratch")
+    (tmp_path / "docs" / "guide.md").write_text("Guide")
+    (tmp_path / "CONTRIBUTING.md").write_text("How to contribute")
+    (tmp_path / "README.md").write_text("My project")
+
+    analysis = analyze_repo(str(tmp_path))
+    found_files = flatten_files(analysis)
+
+    assert "docs/local.md" not in found_files
+    assert "docs/guide.md" in found_files
+    assert "CONTRIBUTING.md" in found_files
+    assert "README.md" in found_files
+
+
+def test_targeted_scan_finds_yaml_workflows_and_requirements_in(tmp_path: Path) -> None:
+    """Gitignored .yaml workflows and requirements*.in files are still picked up."""
+    (tmp_path / ".gitignore").write_text(".github/\nrequirements*\n")
+    (tmp_path / ".github" / "workflows").mkdir(parents=True)
+    (tmp_path / ".github" / "workflows" / "ci.yaml").write_text("on: push\n")
+    (tmp_path / ".github" / "workflows" / "notes.txt").write_text("not a workflow")
+    (tmp_path / "requirements-dev.in").write_text("pytest\n")
+
+    found_files = flatten_files(analyze_repo(str(tmp_path)))
+
+    assert ".github/workflows/ci.yaml" in found_files
+    assert ".github/workflows/notes.txt" not in found_files
+    assert "requirements-dev.in" in found_files
+
+
+def test_edited_gitignore_is_reread_between_analyses(tmp_path: Path) -> None:
+    """Ignore-file contents are cached across calls, but an edit must take effect."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("Guide")
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.log\n")
+
+    assert "docs/guide.md" in flatten_files(analyze_repo(str(tmp_path)))
+
+    gitignore.write_text("*.log\ndocs/\n")
+    assert "docs/guide.md" not in flatten_files(analyze_repo(str(tmp_path)))
+
+
+def test_same_size_gitignore_edit_is_reread(tmp_path: Path) -> None:
+    """A same-size replacement that keeps the mtime must still invalidate the cached lines."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("Guide")
+    gitignore = tmp_path / ".gitignore"
+    old_ns = time.time_ns() - 60_000_000_000
+    gitignore.write_text("docs/\n")
+    os.utime(gitignore, ns=(old_ns, old_ns))
+
+    assert "docs/guide.md" not in flatten_files(analyze_repo(str(tmp_path)))
+
+    # Same size and mtime, written to a new file and renamed over the old one (as editors
+    # save): only the inode differs, and that is deterministic, unlike a coarse ctime.
+    replacement = tmp_path / ".gitignore.new"
+    replacement.write_text("logs/\n")
+    os.utime(replacement, ns=(old_ns, old_ns))
+    os.replace(replacement, gitignore)
+
+    assert "docs/guide.md" in flatten_files(analyze_repo(str(tmp_path)))